@@ -0,0 +1,157 @@
+import asyncio
+import json
+import random
+import socket
+import time
+from dataclasses import asdict, dataclass
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+from benchmarks.synthetic import render_feed, render_html, render_score
+
+
+def free_port() -> int:
+    """Ask the OS for an unused localhost port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _sleep_latency(rng: random.Random, latency_ms: float, jitter_ms: float) -> None:
+    delay = max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000
+    if delay:
+        await asyncio.sleep(delay)
+
+
+@dataclass
+class FeedConfig:
+    companies: int = 2000
+    seed: int = 42
+
+
+@dataclass
+class SiteConfig:
+    latency_ms: float = 50.0
+    jitter_ms: float = 20.0
+    page_bytes: int = 40_000
+    error_rate: float = 0.02
+
+
+@dataclass
+class LLMConfig:
+    latency_ms: float = 800.0
+    jitter_ms: float = 300.0
+    rate_limit_rate: float = 0.05
+    malformed_rate: float = 0.02
+    seed: int = 7
+
+
+@dataclass
+class FakeCounters:
+    """Request tallies reported alongside the benchmark results."""
+    feed_requests: int = 0
+    site_requests: int = 0
+    site_errors: int = 0
+    llm_requests: int = 0
+    llm_rate_limited: int = 0
+    llm_malformed: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def build_feed_app(config: FeedConfig, site_base: str, counters: FakeCounters) -> FastAPI:
+    """YC-OSS stand-in serving `/industries/b2b.json`."""
+    app = FastAPI()
+    payload = render_feed(config.companies, site_base, config.seed)
+
+    @app.get("/industries/b2b.json")
+    async def b2b_feed():
+        counters.feed_requests += 1
+        return Response(content=payload, media_type="application/json")
+
+    return app
+
+
+def build_site_app(config: SiteConfig, counters: FakeCounters) -> FastAPI:
+    """HTML farm serving one landing page per company slug."""
+    app = FastAPI()
+    rng = random.Random(0)
+
+    @app.get("/site/{slug}")
+    async def site(slug: str):
+        counters.site_requests += 1
+        await _sleep_latency(rng, config.latency_ms, config.jitter_ms)
+        if rng.random() < config.error_rate:
+            counters.site_errors += 1
+            return HTMLResponse("<h1>Service Unavailable</h1>", status_code=503)
+        return HTMLResponse(render_html(slug, config.page_bytes))
+
+    return app
+
+
+def build_llm_app(config: LLMConfig, counters: FakeCounters) -> FastAPI:
+    """Anthropic Messages API stand-in with injectable 429s and malformed replies."""
+    app = FastAPI()
+    rng = random.Random(config.seed)
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        counters.llm_requests += 1
+        body = await request.json()
+        await _sleep_latency(rng, config.latency_ms, config.jitter_ms)
+
+        if rng.random() < config.rate_limit_rate:
+            counters.llm_rate_limited += 1
+            return JSONResponse(
+                {"type": "error", "error": {"type": "rate_limit_error", "message": "Rate limited (fake)"}},
+                status_code=429,
+                headers={"retry-after": "0"},
+            )
+
+        if rng.random() < config.malformed_rate:
+            counters.llm_malformed += 1
+            text = "Sure! Here is my assessment: {thesis_fit: 7, market_timing"
+        else:
+            text = json.dumps(render_score(rng))
+
+        prompt = body["messages"][0]["content"]
+        return {
+            "id": f"msg_fake_{counters.llm_requests}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4},
+        }
+
+    return app
+
+
+class LocalServer:
+    """Run an ASGI app on a localhost port inside the current event loop."""
+
+    def __init__(self, app: FastAPI, port: int | None = None):
+        self.port = port or free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning", access_log=False)
+        )
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._server.serve())
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Fake server on port {self.port} failed to start")
+            await asyncio.sleep(0.01)
+
+    async def stop(self) -> None:
+        self._server.should_exit = True
+        if self._task:
+            await self._task
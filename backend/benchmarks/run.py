@@ -0,0 +1,347 @@
+"""End-to-end pipeline benchmark: ingest -> enrich -> score -> serve.
+
+Everything runs against local fakes (YC feed, HTML farm, Anthropic API), so
+no network access or API key is needed. Run from `backend/`:
+
+    python -m benchmarks.run --companies 2000 --output benchmark-report.json
+    python -m benchmarks.run --companies 200000 --stages ingest,serve
+    python -m benchmarks.run --companies 100000 --stages ingest,serve   # tag-filtered listing at 100k
+    python -m benchmarks.run --compare baseline.json --tolerance 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fakes import (
+    FakeCounters,
+    LocalServer,
+    FeedConfig,
+    LLMConfig,
+    SiteConfig,
+    build_feed_app,
+    build_llm_app,
+    build_site_app,
+)
+
+STAGES = ["startup", "ingest", "enrich", "score", "serve"]
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# Times `import src.main` and a full lifespan cycle (startup, then shutdown)
+# in a fresh interpreter; serve-only mode skips init_db and resources.open().
+STARTUP_PROBE = """
+import asyncio, json, sys, time
+
+async def probe():
+    t0 = time.perf_counter()
+    import src.main
+    t1 = time.perf_counter()
+    async with src.main.app.router.lifespan_context(src.main.app):
+        t2 = time.perf_counter()
+        modules = len(sys.modules)
+        llm_loaded = "anthropic" in sys.modules
+    t3 = time.perf_counter()
+    return {"import": t1 - t0, "startup": t2 - t1, "shutdown": t3 - t2,
+            "modules": modules, "llm_loaded": llm_loaded}
+
+print(json.dumps(asyncio.run(probe())))
+"""
+
+DEEP_PAGE_LIMIT = 200
+
+
+def serve_scenarios(companies: int) -> list[tuple[str, str, dict]]:
+    """Load scenarios for a feed of `companies`; the deep page sits mid-dataset."""
+    deep_page = max(1, companies // 2 // DEEP_PAGE_LIMIT)
+    return [
+        ("companies_first_page", "/api/companies", {"limit": 50}),
+        ("companies_filtered", "/api/companies", {"stage": "Seed", "min_score": 5, "limit": 50}),
+        ("companies_search", "/api/companies", {"search": "data", "limit": 50}),
+        ("companies_deep_page", "/api/companies", {"page": deep_page, "limit": DEEP_PAGE_LIMIT}),
+        ("companies_tag_all", "/api/companies", {"tag": ["AI", "SaaS"], "tag_mode": "all", "limit": 50}),
+        ("companies_tag_any", "/api/companies", {"tag": ["Fintech", "Payments", "Compliance"], "tag_mode": "any", "limit": 50}),
+        ("companies_tag_region", "/api/companies", {"tag": "Security", "region": "Europe", "limit": 50}),
+        ("stats", "/api/stats", {}),
+    ]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=2000, help="synthetic feed size (2k-200k)")
+    parser.add_argument("--stages", default=",".join(STAGES), help="comma-separated subset of %s" % STAGES)
+    parser.add_argument("--database-url", help="defaults to a fresh SQLite file in a temp dir")
+    parser.add_argument("--rate-limit-rps", type=int, default=8, help="concurrency for scraping and scoring")
+    parser.add_argument("--score-batches", type=int, default=5, help="number of /score-sized batches to run")
+    parser.add_argument("--score-batch-size", type=int, default=20)
+
+    parser.add_argument("--site-latency-ms", type=float, default=SiteConfig.latency_ms)
+    parser.add_argument("--site-jitter-ms", type=float, default=SiteConfig.jitter_ms)
+    parser.add_argument("--page-bytes", type=int, default=SiteConfig.page_bytes)
+    parser.add_argument("--site-error-rate", type=float, default=SiteConfig.error_rate)
+
+    parser.add_argument("--llm-latency-ms", type=float, default=LLMConfig.latency_ms)
+    parser.add_argument("--llm-jitter-ms", type=float, default=LLMConfig.jitter_ms)
+    parser.add_argument("--llm-429-rate", type=float, default=LLMConfig.rate_limit_rate)
+    parser.add_argument("--llm-malformed-rate", type=float, default=LLMConfig.malformed_rate)
+
+    parser.add_argument("--startup-runs", type=int, default=5, help="cold starts of the app per mode")
+    parser.add_argument("--serve-concurrency", type=int, default=16)
+    parser.add_argument("--serve-requests", type=int, default=500, help="requests per serve scenario")
+
+    parser.add_argument("--output", default="benchmark-report.json")
+    parser.add_argument("--compare", help="baseline report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed fractional regression")
+    args = parser.parse_args(argv)
+
+    args.stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    return args
+
+
+def configure_environment(args: argparse.Namespace, feed_url: str, llm_url: str, workdir: str) -> None:
+    """Point `src.config.settings` at the fakes. Must run before any `src` import."""
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{workdir}/benchmark.db"
+    os.environ["YC_API_BASE"] = feed_url
+    os.environ["ANTHROPIC_API_KEY"] = "sk-ant-fake"
+    os.environ["ANTHROPIC_BASE_URL"] = llm_url
+    os.environ["RATE_LIMIT_RPS"] = str(args.rate_limit_rps)
+    os.environ["SCORE_BATCH_SIZE"] = str(args.score_batch_size)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def stage_result(items: int, seconds: float, **extra) -> dict:
+    return {
+        "items": items,
+        "seconds": round(seconds, 3),
+        "throughput_per_s": round(items / seconds, 2) if seconds else 0.0,
+        **extra,
+    }
+
+
+async def timed(coro) -> tuple[object, float]:
+    start = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - start
+
+
+def measure_startup(runs: int) -> dict:
+    """Cold-start the app in fresh interpreters, with and without serve-only mode.
+
+    `cold_start_ms` is import plus lifespan startup: the time until the app
+    could accept its first request.
+    """
+    results = {}
+    for mode, extra_env in (("full", {"SERVE_ONLY": "false"}), ("serve_only", {"SERVE_ONLY": "true"})):
+        samples = []
+        for _ in range(runs):
+            proc = subprocess.run(
+                [sys.executable, "-c", STARTUP_PROBE],
+                cwd=BACKEND_DIR,
+                env={**os.environ, **extra_env},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+        def summary(ms: list[float]) -> dict:
+            return {
+                "mean": round(statistics.fmean(ms), 2),
+                "min": round(min(ms), 2),
+                "p95": round(percentile(ms, 95), 2),
+            }
+
+        results[mode] = {
+            "runs": runs,
+            "import_ms": summary([s["import"] * 1000 for s in samples]),
+            "lifespan_startup_ms": summary([s["startup"] * 1000 for s in samples]),
+            "lifespan_shutdown_ms": summary([s["shutdown"] * 1000 for s in samples]),
+            "cold_start_ms": summary([(s["import"] + s["startup"]) * 1000 for s in samples]),
+            "modules_loaded": samples[-1]["modules"],
+            "llm_client_loaded": samples[-1]["llm_loaded"],
+        }
+    return results
+
+
+async def run_pipeline_stages(args: argparse.Namespace) -> dict:
+    from src.db.database import init_db, read_session
+    from src.services.enrich import run_enrichment
+    from src.services.ingest import run_ingestion
+    from src.services.scorer import run_scoring
+
+    await init_db()
+    results: dict = {}
+
+    if "ingest" in args.stages:
+        async with read_session() as session:
+            count, seconds = await timed(run_ingestion(session))
+        results["ingest"] = stage_result(count, seconds)
+
+    if "enrich" in args.stages:
+        async with read_session() as session:
+            count, seconds = await timed(run_enrichment(session))
+        results["enrich"] = stage_result(count, seconds)
+
+    if "score" in args.stages:
+        total, elapsed = 0, 0.0
+        for _ in range(args.score_batches):
+            async with read_session() as session:
+                count, seconds = await timed(run_scoring(session, batch_size=args.score_batch_size))
+            total += count
+            elapsed += seconds
+        results["score"] = stage_result(total, elapsed, batches=args.score_batches)
+
+    return results
+
+
+async def run_scenario(client: httpx.AsyncClient, path: str, params: dict, requests: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path, params=params)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": round(wall, 3),
+        "throughput_per_s": round(requests / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(max(latencies), 2) if latencies else 0.0,
+        },
+    }
+
+
+async def run_serve_stage(args: argparse.Namespace) -> dict:
+    from src.main import app
+
+    server = LocalServer(app)
+    await server.start()
+    results = {}
+    try:
+        async with httpx.AsyncClient(
+            base_url=server.url,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=args.serve_concurrency),
+        ) as client:
+            for name, path, params in serve_scenarios(args.companies):
+                # One warm-up request so the first sample isn't a cold cache.
+                await client.get(path, params=params)
+                results[name] = await run_scenario(
+                    client, path, params, args.serve_requests, args.serve_concurrency
+                )
+    finally:
+        await server.stop()
+    return results
+
+
+def compare_reports(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return human-readable regressions beyond `tolerance` (e.g. 0.2 = 20%)."""
+    regressions = []
+    for section in ("startup", "pipeline", "serve"):
+        for name, base in baseline.get(section, {}).items():
+            now = current.get(section, {}).get(name)
+            if not now:
+                continue
+            base_tp, now_tp = base.get("throughput_per_s", 0), now.get("throughput_per_s", 0)
+            if base_tp and now_tp < base_tp * (1 - tolerance):
+                regressions.append(f"{section}.{name}: throughput {now_tp}/s vs baseline {base_tp}/s")
+            for latency in ("latency_ms", "import_ms", "cold_start_ms"):
+                base_p95 = base.get(latency, {}).get("p95")
+                now_p95 = now.get(latency, {}).get("p95")
+                if base_p95 and now_p95 and now_p95 > base_p95 * (1 + tolerance):
+                    regressions.append(f"{section}.{name}: {latency} p95 {now_p95} vs baseline {base_p95}")
+    return regressions
+
+
+async def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    counters = FakeCounters()
+
+    site = LocalServer(build_site_app(SiteConfig(
+        latency_ms=args.site_latency_ms,
+        jitter_ms=args.site_jitter_ms,
+        page_bytes=args.page_bytes,
+        error_rate=args.site_error_rate,
+    ), counters))
+    feed = LocalServer(build_feed_app(FeedConfig(companies=args.companies), site.url, counters))
+    llm = LocalServer(build_llm_app(LLMConfig(
+        latency_ms=args.llm_latency_ms,
+        jitter_ms=args.llm_jitter_ms,
+        rate_limit_rate=args.llm_429_rate,
+        malformed_rate=args.llm_malformed_rate,
+    ), counters))
+
+    with tempfile.TemporaryDirectory(prefix="venturesignal-bench-") as workdir:
+        configure_environment(args, feed.url, llm.url, workdir)
+        startup = measure_startup(args.startup_runs) if "startup" in args.stages else {}
+        for server in (site, feed, llm):
+            await server.start()
+        try:
+            pipeline = await run_pipeline_stages(args)
+            serve = await run_serve_stage(args) if "serve" in args.stages else {}
+        finally:
+            for server in (site, feed, llm):
+                await server.stop()
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        "startup": startup,
+        "pipeline": pipeline,
+        "serve": serve,
+        "fakes": counters.as_dict(),
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(json.dumps({"startup": startup, "pipeline": pipeline, "serve": serve}, indent=2))
+    print(f"Report written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare_reports(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,114 @@
+import json
+import random
+
+STAGES = ["Early", "Seed", "Series A", "Series B", "Series C", "Growth"]
+STATUSES = ["Active", "Active", "Active", "Acquired", "Inactive"]
+SUBINDUSTRIES = [
+    "B2B -> Engineering, Product and Design",
+    "B2B -> Finance and Accounting",
+    "B2B -> Human Resources",
+    "B2B -> Infrastructure",
+    "B2B -> Legal",
+    "B2B -> Marketing",
+    "B2B -> Analytics",
+    "B2B -> Security",
+    "B2B -> Sales",
+    "B2B -> Supply Chain and Logistics",
+]
+TAGS = [
+    "SaaS", "AI", "Developer Tools", "Fintech", "Analytics", "Security",
+    "Infrastructure", "Marketplace", "API", "Enterprise", "Open Source",
+    "Machine Learning", "Compliance", "Payments", "HR Tech", "Logistics",
+]
+REGIONS = [
+    "United States of America", "America / Canada", "Europe", "United Kingdom",
+    "India", "Latin America", "Southeast Asia", "Remote",
+]
+WORDS = [
+    "platform", "workflow", "automation", "data", "teams", "cloud", "revenue",
+    "pipeline", "customers", "insights", "compliance", "agents", "billing",
+    "infrastructure", "developers", "security", "operations", "scale",
+]
+
+
+def _batch(rng: random.Random) -> str:
+    return f"{rng.choice('WS')}{rng.randint(5, 25):02d}"
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n_words)).capitalize() + "."
+
+
+def generate_companies(count: int, site_base: str, seed: int = 42) -> list[dict]:
+    """Generate `count` companies shaped like the YC-OSS B2B feed.
+
+    Websites point at the local HTML farm (`{site_base}/site/{slug}`) so the
+    enrichment stage never leaves the machine.
+    """
+    rng = random.Random(seed)
+    companies = []
+    for i in range(1, count + 1):
+        slug = f"synthetic-co-{i}"
+        companies.append({
+            "id": i,
+            "name": f"Synthetic Co {i}",
+            "slug": slug,
+            "former_names": [],
+            "small_logo_thumb_url": "",
+            "website": f"{site_base}/site/{slug}",
+            "all_locations": rng.choice(REGIONS),
+            "long_description": " ".join(_sentence(rng, 12) for _ in range(3)),
+            "one_liner": _sentence(rng, 8),
+            "team_size": rng.choice([1, 2, 3, 5, 8, 12, 20, 40, 100, 250]),
+            "industry": "B2B",
+            "subindustry": rng.choice(SUBINDUSTRIES),
+            "launched_at": 1_600_000_000 + i,
+            "tags": rng.sample(TAGS, rng.randint(1, 4)),
+            "top_company": rng.random() < 0.05,
+            "isHiring": rng.random() < 0.3,
+            "nonprofit": False,
+            "batch": _batch(rng),
+            "status": rng.choice(STATUSES),
+            "industries": ["B2B"],
+            "regions": rng.sample(REGIONS, rng.randint(1, 2)),
+            "stage": rng.choice(STAGES),
+            "url": f"https://www.ycombinator.com/companies/{slug}",
+        })
+    return companies
+
+
+def render_feed(count: int, site_base: str, seed: int = 42) -> bytes:
+    """Serialize a synthetic feed once so it can be served without re-encoding."""
+    return json.dumps(generate_companies(count, site_base, seed)).encode()
+
+
+def render_html(slug: str, size_bytes: int, seed: int = 0) -> str:
+    """Build a company landing page padded to roughly `size_bytes`."""
+    rng = random.Random(f"{slug}:{seed}")
+    head = (
+        "<!doctype html><html><head>"
+        f"<title>{slug} | The {rng.choice(WORDS)} {rng.choice(WORDS)} company</title>"
+        f'<meta name="description" content="{_sentence(rng, 14)}">'
+        "<style>body{font-family:sans-serif}</style>"
+        "<script>window.analytics=[];</script>"
+        "</head><body><header><nav><a href='/'>Home</a><a href='/pricing'>Pricing</a></nav></header><main>"
+    )
+    tail = "</main><footer>&copy; synthetic</footer></body></html>"
+    sections = []
+    size = len(head) + len(tail)
+    while size < size_bytes:
+        section = f"<section><h2>{_sentence(rng, 3)}</h2><p>{_sentence(rng, 40)}</p></section>"
+        sections.append(section)
+        size += len(section)
+    return head + "".join(sections) + tail
+
+
+def render_score(rng: random.Random) -> dict:
+    """A well-formed scoring reply in the shape the thesis prompt asks for."""
+    dims = ["thesis_fit", "market_timing", "product_clarity", "team_signal", "overall_signal"]
+    scores = {d: rng.randint(1, 10) for d in dims}
+    return {
+        **scores,
+        "one_line_verdict": _sentence(rng, 10),
+        "reasoning": {d: _sentence(rng, 20) for d in dims},
+    }
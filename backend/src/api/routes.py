@@ -1,29 +1,60 @@
-import json
+import importlib.util
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.database import get_session
+from src.db.database import get_read_session
 from src.models.company import CompanyDB, CompanyResponse
+from src.models.facets import FacetsResponse
 from src.models.scores import ScoreDB, ScoreResponse
-from src.services.enrich import run_enrichment
-from src.services.ingest import run_ingestion
-from src.services.scorer import run_rescore_all, run_scoring
+from src.services.export import MEDIA_TYPES, build_export_query, export_slots, stream_export
+from src.services.facets import get_facets
+from src.services.filters import CompanyFilters, apply_company_filters
+from src.services.labels import load_labels
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api")
+# Pipeline endpoints import their services (anthropic, bs4) on first use and
+# are left out entirely in serve-only replicas.
+pipeline_router = APIRouter(prefix="/api")
 
 
-@router.get("/companies", response_model=list[CompanyResponse])
-async def list_companies(
-    session: AsyncSession = Depends(get_session),
+def company_filters(
     stage: str | None = None,
     industry: str | None = None,
     batch: str | None = None,
     min_score: int | None = None,
     search: str | None = None,
+    tag: list[str] = Query(default=[]),
+    tag_mode: str = Query("all", pattern="^(all|any)$"),
+    region: list[str] = Query(default=[]),
+    region_mode: str = Query("all", pattern="^(all|any)$"),
+) -> CompanyFilters:
+    """Query parameters shared by the listing, facet and export endpoints.
+
+    `tag`/`region` may be repeated; `*_mode=all` requires every value (AND),
+    `any` requires at least one (OR).
+    """
+    return CompanyFilters(
+        stage=stage,
+        industry=industry,
+        batch=batch,
+        min_score=min_score,
+        search=search,
+        tags=tuple(tag),
+        tag_mode=tag_mode,
+        regions=tuple(region),
+        region_mode=region_mode,
+    )
+
+
+@router.get("/companies", response_model=list[CompanyResponse])
+async def list_companies(
+    session: AsyncSession = Depends(get_read_session),
+    filters: CompanyFilters = Depends(company_filters),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=200),
 ):
@@ -31,26 +62,14 @@ async def list_companies(
     query = select(CompanyDB, ScoreDB).outerjoin(
         ScoreDB, CompanyDB.id == ScoreDB.company_id
     )
-
-    if stage:
-        query = query.where(CompanyDB.stage == stage)
-    if industry:
-        query = query.where(CompanyDB.industry == industry)
-    if batch:
-        query = query.where(CompanyDB.batch == batch)
-    if min_score is not None:
-        query = query.where(ScoreDB.overall_signal >= min_score)
-    if search:
-        query = query.where(
-            CompanyDB.name.ilike(f"%{search}%")
-            | CompanyDB.one_liner.ilike(f"%{search}%")
-        )
+    query = apply_company_filters(query, filters)
 
     query = query.order_by(ScoreDB.overall_signal.desc().nullslast())
     query = query.offset((page - 1) * limit).limit(limit)
 
     result = await session.execute(query)
     rows = result.all()
+    labels = await load_labels(session, [company.id for company, _ in rows])
 
     companies = []
     for company, score in rows:
@@ -67,8 +86,8 @@ async def list_companies(
             "stage": company.stage,
             "team_size": company.team_size,
             "batch": company.batch,
-            "tags": json.loads(company.tags) if company.tags else [],
-            "regions": json.loads(company.regions) if company.regions else [],
+            "tags": labels["tags"].get(company.id, []),
+            "regions": labels["regions"].get(company.id, []),
             "enriched_text": company.enriched_text,
             "enriched_at": company.enriched_at,
             "created_at": company.created_at,
@@ -88,10 +107,42 @@ async def list_companies(
     return companies
 
 
+@router.get("/facets", response_model=FacetsResponse)
+async def list_facets(
+    session: AsyncSession = Depends(get_read_session),
+    filters: CompanyFilters = Depends(company_filters),
+):
+    """Value counts for each filterable field, conditioned on the current filters."""
+    return await get_facets(session, filters)
+
+
+@router.get("/export")
+async def export_companies(
+    format: str = Query("ndjson", pattern="^(ndjson|csv|parquet)$"),
+    include_reasoning: bool = False,
+    filters: CompanyFilters = Depends(company_filters),
+):
+    """Stream all matching companies with their latest scores as NDJSON, CSV or Parquet."""
+    if format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+    if export_slots.locked():
+        raise HTTPException(status_code=429, detail="Too many concurrent exports, try again later")
+
+    query = build_export_query(include_reasoning)
+    query = apply_company_filters(query, filters)
+    logger.info("Starting %s export (reasoning=%s)", format, include_reasoning)
+
+    return StreamingResponse(
+        stream_export(query, format, include_reasoning),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="companies.{format}"'},
+    )
+
+
 @router.get("/companies/{company_id}")
 async def get_company(
     company_id: int,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Get a single company with full score detail."""
     result = await session.execute(
@@ -104,6 +155,7 @@ async def get_company(
         return {"error": "Company not found"}
 
     company, score = row
+    labels = await load_labels(session, [company.id])
     data = {
         "id": company.id,
         "name": company.name,
@@ -117,8 +169,8 @@ async def get_company(
         "stage": company.stage,
         "team_size": company.team_size,
         "batch": company.batch,
-        "tags": json.loads(company.tags) if company.tags else [],
-        "regions": json.loads(company.regions) if company.regions else [],
+        "tags": labels["tags"].get(company.id, []),
+        "regions": labels["regions"].get(company.id, []),
         "enriched_text": company.enriched_text,
         "enriched_at": company.enriched_at,
         "created_at": company.created_at,
@@ -151,47 +203,55 @@ async def get_company(
     return {"company": CompanyResponse(**data), "score_detail": score_data}
 
 
-@router.post("/ingest")
+@pipeline_router.post("/ingest")
 async def trigger_ingest(
     background_tasks: BackgroundTasks,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Trigger data ingestion from YC-OSS API."""
+    from src.services.ingest import run_ingestion
+
     count = await run_ingestion(session)
     return {"status": "completed", "companies_upserted": count}
 
 
-@router.post("/enrich")
+@pipeline_router.post("/enrich")
 async def trigger_enrich(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Trigger website enrichment for unenriched companies."""
+    from src.services.enrich import run_enrichment
+
     count = await run_enrichment(session)
     return {"status": "completed", "companies_enriched": count}
 
 
-@router.post("/score")
+@pipeline_router.post("/score")
 async def trigger_score(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     batch_size: int = Query(default=20, ge=1, le=100),
 ):
     """Trigger LLM scoring batch."""
+    from src.services.scorer import run_scoring
+
     count = await run_scoring(session, batch_size=batch_size)
     return {"status": "completed", "companies_scored": count}
 
 
-@router.post("/rescore")
+@pipeline_router.post("/rescore")
 async def trigger_rescore(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     batch_size: int = Query(default=20, ge=1, le=100),
 ):
     """Delete all scores and rescore all companies with current thesis."""
+    from src.services.scorer import run_rescore_all
+
     count = await run_rescore_all(session, batch_size=batch_size)
     return {"status": "completed", "companies_rescored": count}
 
 
 @router.get("/stats")
-async def get_stats(session: AsyncSession = Depends(get_session)):
+async def get_stats(session: AsyncSession = Depends(get_read_session)):
     """Get dashboard summary statistics."""
     total = await session.execute(select(func.count(CompanyDB.id)))
     total_count = total.scalar() or 0
@@ -3,12 +3,36 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./venturesignal.db"
+    # PostgreSQL connection pool
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # SQLite tuning (WAL is always on)
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size: int = 268_435_456
+    sqlite_read_pool_size: int = 5
+    # Concurrent /api/export streams; each holds a connection from its own pool
+    export_max_concurrent: int = 2
+    # Single-writer queue: max jobs grouped into one commit, and how long to wait for more
+    write_group_max: int = 100
+    write_group_wait_ms: float = 5.0
     anthropic_api_key: str = ""
+    anthropic_base_url: str | None = None
     openai_api_key: str = ""
     yc_api_base: str = "https://yc-oss.github.io/api"
     score_batch_size: int = 20
     rate_limit_rps: int = 2
     model_name: str = "claude-sonnet-4-5-20250929"
+    serve_only: bool = False  # read-only replica: no pipeline routes, clients or migrations
+    http_timeout: float = 10.0
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    worker_id: str = ""  # defaults to "<hostname>-<pid>"
+    lease_seconds: int = 600
+    enrich_batch_size: int = 50
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
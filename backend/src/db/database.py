@@ -1,10 +1,82 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from src.config import settings
+from src.db.migrations import run_migrations
+from src.metrics import instrument_engine
+
+IS_SQLITE = make_url(settings.database_url).get_backend_name() == "sqlite"
+
+
+def _sqlite_pragmas(read_only: bool):
+    statements = [
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    # journal_mode is persisted in the database file, so only the writer sets it.
+    statements.insert(0, "PRAGMA query_only=ON" if read_only else "PRAGMA journal_mode=WAL")
+
+    def apply(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+    return apply
+
+
+def _create_engine(read_only: bool = False, pool_size: int | None = None) -> AsyncEngine:
+    """Build an engine tuned for the configured backend.
+
+    SQLite gets one writer connection (all writes go through `src.db.writer`)
+    and a separate pool of query-only readers, so dashboard reads never queue
+    behind a long pipeline transaction. Other backends use the pool settings.
+    A fixed `pool_size` gives a dedicated pool with no overflow on either backend.
+    """
+    if pool_size is not None:
+        kwargs = {"pool_size": pool_size, "max_overflow": 0, "pool_timeout": settings.db_pool_timeout}
+        if IS_SQLITE:
+            kwargs["connect_args"] = {"timeout": settings.sqlite_busy_timeout_ms / 1000}
+        else:
+            kwargs.update(pool_recycle=settings.db_pool_recycle, pool_pre_ping=settings.db_pool_pre_ping)
+    elif IS_SQLITE:
+        kwargs = {
+            "pool_size": settings.sqlite_read_pool_size if read_only else 1,
+            "max_overflow": 0,
+            "pool_timeout": settings.db_pool_timeout,
+            "connect_args": {"timeout": settings.sqlite_busy_timeout_ms / 1000},
+        }
+    else:
+        kwargs = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+
+    new_engine = create_async_engine(settings.database_url, echo=False, **kwargs)
+    if IS_SQLITE:
+        event.listen(new_engine.sync_engine, "connect", _sqlite_pragmas(read_only))
+    instrument_engine(new_engine.sync_engine)
+    return new_engine
+
+
+engine = _create_engine()
+# PostgreSQL handles concurrent readers and writers itself, so one pool is enough.
+read_engine = _create_engine(read_only=True) if IS_SQLITE else engine
+# Exports hold a connection for the whole download, so they get their own
+# pool and can never exhaust the one dashboard reads use.
+export_engine = _create_engine(read_only=True, pool_size=settings.export_max_concurrent)
 
-engine = create_async_engine(settings.database_url, echo=False)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+export_session = async_sessionmaker(export_engine, class_=AsyncSession, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
@@ -14,8 +86,9 @@ class Base(DeclarativeBase):
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations, Base.metadata)
 
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
+async def get_read_session() -> AsyncSession:
+    async with read_session() as session:
         yield session
@@ -0,0 +1,78 @@
+import json
+import logging
+
+from sqlalchemy import Connection, MetaData, inspect, text
+from sqlalchemy.schema import CreateIndex
+
+logger = logging.getLogger(__name__)
+
+
+def add_missing_columns(conn: Connection, metadata: MetaData) -> None:
+    """Add model columns that are missing from tables created by an older release.
+
+    `create_all` only creates missing tables, so new nullable columns on
+    existing tables have to be added here.
+    """
+    inspector = inspect(conn)
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+            logger.info("Added column %s.%s", table.name, column.name)
+            for index in table.indexes:
+                if column.name in index.columns:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def normalize_tags_and_regions(conn: Connection) -> None:
+    """Move the legacy JSON-string `companies.tags`/`regions` columns into the
+    `company_tags`/`company_regions` association tables, then drop them.
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table("companies"):
+        return
+    columns = {c["name"] for c in inspector.get_columns("companies")}
+    legacy = [("tags", "company_tags", "tag"), ("regions", "company_regions", "region")]
+    if not any(column in columns for column, _, _ in legacy):
+        return
+
+    for column, table, label in legacy:
+        if column not in columns:
+            continue
+        rows = conn.execute(text(f"SELECT id, {column} FROM companies WHERE {column} IS NOT NULL"))
+        pairs = []
+        for company_id, raw in rows:
+            try:
+                values = json.loads(raw)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if isinstance(values, list):
+                pairs += [
+                    {"company_id": company_id, "label": v}
+                    for v in dict.fromkeys(values) if isinstance(v, str) and v
+                ]
+        if pairs:
+            conn.execute(
+                text(
+                    f"INSERT INTO {table} (company_id, {label}) VALUES (:company_id, :label) "
+                    "ON CONFLICT DO NOTHING"
+                ),
+                pairs,
+            )
+        conn.execute(text(f"ALTER TABLE companies DROP COLUMN {column}"))
+        logger.info("Moved %d %s from companies.%s into %s", len(pairs), column, column, table)
+
+    # Facet counts were built from the JSON columns; rebuild on next read.
+    if inspector.has_table("data_generation"):
+        conn.execute(text("DELETE FROM data_generation"))
+
+
+def run_migrations(conn: Connection, metadata: MetaData) -> None:
+    """Bring an existing database up to the current schema. Safe to re-run."""
+    add_missing_columns(conn, metadata)
+    normalize_tags_and_regions(conn)
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.db.database import async_session
+from src.metrics import DB_WRITE_GROUP_SIZE, DB_WRITE_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+WriteJob = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class WriteQueue:
+    """Funnel every write through one task that groups jobs into shared commits.
+
+    A job is an async callable taking the writer's session; it must not commit.
+    Jobs that arrive within `write_group_wait_ms` of each other are committed
+    together. If any job in a group fails, the group is rolled back and each
+    job is retried in its own transaction so one bad job can't sink the rest.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    def _ensure_running(self) -> asyncio.Queue:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(), name="db-writer")
+        return self._queue
+
+    async def submit(self, job: WriteJob) -> Any:
+        """Queue `job` and wait until it has been committed. Returns its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_running().put_nowait((job, future))
+        DB_WRITE_QUEUE_DEPTH.inc()
+        return await future
+
+    async def stop(self) -> None:
+        """Finish queued work, then stop the writer task."""
+        if self._task is None or self._task.done():
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _collect_group(self) -> list:
+        group = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.write_group_wait_ms / 1000
+        while len(group) < settings.write_group_max:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                group.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return group
+
+    async def _run(self) -> None:
+        while True:
+            group = await self._collect_group()
+            DB_WRITE_QUEUE_DEPTH.dec(len(group))
+            DB_WRITE_GROUP_SIZE.observe(len(group))
+            try:
+                await self._commit_group(group)
+            finally:
+                for _ in group:
+                    self._queue.task_done()
+
+    async def _commit_group(self, group: list) -> None:
+        try:
+            async with self._session_factory() as session:
+                results = [await job(session) for job, _ in group]
+                await session.commit()
+        except Exception as e:
+            if len(group) == 1:
+                logger.exception("Write job failed")
+                _settle(group[0][1], exc=e)
+                return
+            logger.warning("Group commit of %d jobs failed; retrying individually", len(group))
+            for item in group:
+                await self._commit_group([item])
+            return
+
+        for (_, future), result in zip(group, results):
+            _settle(future, result=result)
+
+
+def _settle(future: asyncio.Future, result: Any = None, exc: BaseException | None = None) -> None:
+    if future.done():  # submitter was cancelled
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+writer = WriteQueue(async_session)
@@ -1,19 +1,33 @@
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from src.api.routes import router
+from src.api.routes import pipeline_router, router
+from src.config import settings
 from src.db.database import init_db
+from src.db.writer import writer
+from src.metrics import HTTP_REQUEST_DURATION
+from src.resources import resources
+from src.services.facets import ensure_facets
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db()
+    # Serve-only replicas skip migrations and never build pipeline clients.
+    if not settings.serve_only:
+        await init_db()
+        await writer.submit(ensure_facets)
+        resources.open()
+    app.state.resources = resources
     yield
+    await writer.stop()
+    await resources.aclose()
 
 
 app = FastAPI(
@@ -32,8 +46,34 @@ app.add_middleware(
 )
 
 app.include_router(router)
+if not settings.serve_only:
+    app.include_router(pipeline_router)
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template (/api/companies/{company_id}), not raw path,
+        # so the series count stays bounded.
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.labels(
+            request.method,
+            getattr(route, "path", "unmatched"),
+            str(status),
+        ).observe(time.perf_counter() - start)
 
 
 @app.get("/")
 async def root():
     return {"message": "VentureSignal API is running", "docs": "/docs"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,135 @@
+import time
+from contextlib import asynccontextmanager
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Buckets tuned per stage: SQL is sub-millisecond to seconds, LLM calls are seconds.
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+BYTE_BUCKETS = (1_000, 5_000, 20_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "venturesignal_http_request_duration_seconds",
+    "API request latency by route template.",
+    ["method", "route", "status"],
+    buckets=FAST_BUCKETS,
+)
+
+DB_QUERY_DURATION = Histogram(
+    "venturesignal_db_query_duration_seconds",
+    "SQL statement execution time by statement type.",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+
+# Every company has its own domain, so scrape metrics carry no host label:
+# it would create one series per company.
+SCRAPE_DURATION = Histogram(
+    "venturesignal_scrape_duration_seconds",
+    "Website fetch latency by outcome.",
+    ["outcome"],
+    buckets=SLOW_BUCKETS,
+)
+
+SCRAPE_BYTES = Counter(
+    "venturesignal_scrape_bytes_total",
+    "Response bytes downloaded from company websites.",
+)
+
+SCRAPE_RESPONSE_SIZE = Histogram(
+    "venturesignal_scrape_response_bytes",
+    "Distribution of scraped page sizes.",
+    buckets=BYTE_BUCKETS,
+)
+
+HTML_PARSE_DURATION = Histogram(
+    "venturesignal_html_parse_duration_seconds",
+    "Time spent parsing and extracting text from scraped HTML.",
+    buckets=FAST_BUCKETS,
+)
+
+LLM_REQUEST_DURATION = Histogram(
+    "venturesignal_llm_request_duration_seconds",
+    "LLM scoring call latency.",
+    ["model", "outcome"],
+    buckets=SLOW_BUCKETS,
+)
+
+LLM_TOKENS = Counter(
+    "venturesignal_llm_tokens_total",
+    "LLM tokens consumed, split by direction.",
+    ["model", "direction"],
+)
+
+LLM_ERRORS = Counter(
+    "venturesignal_llm_errors_total",
+    "LLM scoring failures by exception class.",
+    ["model", "error"],
+)
+
+RATE_LIMIT_WAIT = Histogram(
+    "venturesignal_rate_limit_wait_seconds",
+    "Time spent waiting for a rate-limiter slot.",
+    ["stage"],
+    buckets=SLOW_BUCKETS,
+)
+
+DB_WRITE_GROUP_SIZE = Histogram(
+    "venturesignal_db_write_group_size",
+    "Write jobs committed together by the single-writer queue.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250),
+)
+
+DB_WRITE_QUEUE_DEPTH = Gauge(
+    "venturesignal_db_write_queue_depth",
+    "Write jobs waiting for the single-writer queue.",
+)
+
+PIPELINE_IN_FLIGHT = Gauge(
+    "venturesignal_pipeline_in_flight",
+    "Items currently holding a rate-limiter slot.",
+    ["stage"],
+)
+
+PIPELINE_QUEUED = Gauge(
+    "venturesignal_pipeline_queued",
+    "Items waiting for a rate-limiter slot.",
+    ["stage"],
+)
+
+
+@asynccontextmanager
+async def rate_limited(semaphore, stage: str):
+    """Acquire `semaphore`, recording queue depth, wait time and in-flight count."""
+    queued = PIPELINE_QUEUED.labels(stage)
+    queued.inc()
+    start = time.perf_counter()
+    try:
+        await semaphore.acquire()
+    finally:
+        queued.dec()
+    RATE_LIMIT_WAIT.labels(stage).observe(time.perf_counter() - start)
+
+    in_flight = PIPELINE_IN_FLIGHT.labels(stage)
+    in_flight.inc()
+    try:
+        yield
+    finally:
+        in_flight.dec()
+        semaphore.release()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement executed on `engine` via SQLAlchemy cursor events."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+        DB_QUERY_DURATION.labels(operation).observe(elapsed)
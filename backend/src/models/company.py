@@ -2,7 +2,8 @@ import json
 from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import relationship
 
 from src.db.database import Base
 
@@ -24,13 +25,48 @@ class CompanyDB(Base):
     stage = Column(String)
     team_size = Column(Integer)
     batch = Column(String)
-    tags = Column(Text)  # JSON array as string
-    regions = Column(Text)  # JSON array as string
     enriched_text = Column(Text)
     enriched_at = Column(DateTime)
+    # Work-queue leases so concurrent workers never pick the same row
+    enrich_lease_owner = Column(String)
+    enrich_lease_expires_at = Column(DateTime)
+    score_lease_owner = Column(String)
+    score_lease_expires_at = Column(DateTime)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # Tags and regions live in indexed association tables. They are never
+    # loaded implicitly: hot paths read and write them with Core statements
+    # (src.services.labels); other callers opt in with selectinload().
+    tag_rows = relationship("CompanyTagDB", lazy="raise", cascade="all, delete-orphan", passive_deletes=True)
+    region_rows = relationship("CompanyRegionDB", lazy="raise", cascade="all, delete-orphan", passive_deletes=True)
+
+    @property
+    def tags(self) -> list[str]:
+        """Requires `tag_rows` to have been loaded with selectinload()."""
+        return [row.tag for row in self.tag_rows]
+
+    @property
+    def regions(self) -> list[str]:
+        """Requires `region_rows` to have been loaded with selectinload()."""
+        return [row.region for row in self.region_rows]
+
+
+class CompanyTagDB(Base):
+    __tablename__ = "company_tags"
+    __table_args__ = (Index("ix_company_tags_tag_company", "tag", "company_id"),)
+
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String, primary_key=True)
+
+
+class CompanyRegionDB(Base):
+    __tablename__ = "company_regions"
+    __table_args__ = (Index("ix_company_regions_region_company", "region", "company_id"),)
+
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True)
+    region = Column(String, primary_key=True)
+
 
 # --- Pydantic schemas ---
 
@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String
+
+from src.db.database import Base
+
+
+# --- SQLAlchemy ORM models ---
+
+class FacetCountDB(Base):
+    """Precomputed unfiltered facet counts, adjusted incrementally on every write."""
+    __tablename__ = "facet_counts"
+
+    facet = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class DataGenerationDB(Base):
+    """Single-row counter bumped whenever facet-relevant data changes."""
+    __tablename__ = "data_generation"
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+
+
+# --- Pydantic schemas ---
+
+class FacetValue(BaseModel):
+    value: str
+    count: int
+
+
+class FacetsResponse(BaseModel):
+    generation: int
+    facets: dict[str, list[FacetValue]]
@@ -0,0 +1,93 @@
+import logging
+from pathlib import Path
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+USER_AGENT = "VentureSignal/1.0 (research bot)"
+
+
+class PromptTemplate:
+    """A prompt file cached in memory and re-read when its mtime changes."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._text: str | None = None
+        self._mtime: float | None = None
+
+    def get(self) -> str:
+        mtime = self.path.stat().st_mtime
+        if self._text is None or mtime != self._mtime:
+            self._text = self.path.read_text()
+            self._mtime = mtime
+            logger.info("Loaded prompt template from %s", self.path)
+        return self._text
+
+    def reload(self) -> str:
+        self._text = None
+        return self.get()
+
+
+class Resources:
+    """Long-lived clients shared by the pipeline services.
+
+    The FastAPI lifespan opens and closes this registry. Clients are also
+    created on first use, so CLI workers and benchmarks work without a
+    lifespan. `anthropic` is only imported once an LLM client is needed.
+    """
+
+    def __init__(self):
+        self.thesis = PromptTemplate(PROMPTS_DIR / "thesis.txt")
+        self._http: httpx.AsyncClient | None = None
+        self._llm = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled client for scraping and feed downloads."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=settings.http_timeout,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive,
+                ),
+            )
+        return self._http
+
+    @property
+    def llm(self):
+        """Shared `anthropic.AsyncAnthropic` client."""
+        if self._llm is None:
+            import anthropic
+
+            self._llm = anthropic.AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                base_url=settings.anthropic_base_url,
+            )
+        return self._llm
+
+    def open(self) -> None:
+        """Load prompts and the HTTP client up front instead of on the first request.
+
+        The LLM client stays lazy: importing `anthropic` is the slowest part of
+        startup, so it is paid on the first scoring call instead.
+        """
+        self.thesis.get()
+        self.http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._llm is not None:
+            await self._llm.close()
+            self._llm = None
+
+
+resources = Resources()
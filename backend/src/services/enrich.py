@@ -1,14 +1,19 @@
 import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from functools import partial
 
 import httpx
 from bs4 import BeautifulSoup
-from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
+from src.db.writer import writer
+from src.metrics import HTML_PARSE_DURATION, SCRAPE_BYTES, SCRAPE_DURATION, SCRAPE_RESPONSE_SIZE, rate_limited
 from src.models.company import CompanyDB
+from src.resources import resources
+from src.services.leasing import claim_batch, load_companies, release, utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -19,20 +24,26 @@ semaphore = asyncio.Semaphore(settings.rate_limit_rps)
 
 async def scrape_website(url: str) -> str | None:
     """Scrape a website and extract text content."""
-    async with semaphore:
+    async with rate_limited(semaphore, "enrich"):
+        start = time.perf_counter()
         try:
-            async with httpx.AsyncClient(
-                timeout=SCRAPE_TIMEOUT,
-                follow_redirects=True,
-                headers={"User-Agent": "VentureSignal/1.0 (research bot)"},
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            response = await resources.http.get(url, timeout=SCRAPE_TIMEOUT)
+            response.raise_for_status()
         except (httpx.HTTPError, httpx.TimeoutException) as e:
+            SCRAPE_DURATION.labels(type(e).__name__).observe(time.perf_counter() - start)
             logger.warning("Failed to scrape %s: %s", url, e)
             return None
+        SCRAPE_DURATION.labels("ok").observe(time.perf_counter() - start)
+        SCRAPE_BYTES.inc(len(response.content))
+        SCRAPE_RESPONSE_SIZE.observe(len(response.content))
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    with HTML_PARSE_DURATION.time():
+        return _extract_text(response.text)
+
+
+def _extract_text(html: str) -> str | None:
+    """Pull title, meta description and visible body text out of a page."""
+    soup = BeautifulSoup(html, "html.parser")
 
     # Remove script and style elements
     for tag in soup(["script", "style", "nav", "footer", "header"]):
@@ -55,40 +66,49 @@ async def scrape_website(url: str) -> str | None:
     return "\n".join(parts) if parts else None
 
 
-async def enrich_company(session: AsyncSession, company: CompanyDB) -> bool:
-    """Enrich a single company with scraped website data."""
+async def enrich_company(company: CompanyDB) -> str | None:
+    """Scrape a single company's website. Returns the extracted text, if any."""
     if not company.website:
-        return False
+        return None
 
     url = company.website
     if not url.startswith("http"):
         url = f"https://{url}"
 
-    text = await scrape_website(url)
-    if text:
-        company.enriched_text = text
-        company.enriched_at = datetime.now(timezone.utc)
-        return True
-
-    return False
+    return await scrape_website(url)
 
 
-async def run_enrichment(session: AsyncSession) -> int:
-    """Enrich all companies that haven't been enriched yet. Returns count."""
-    result = await session.execute(
-        select(CompanyDB).where(
-            CompanyDB.enriched_at.is_(None),
-            CompanyDB.website.isnot(None),
-            CompanyDB.website != "",
+async def save_enrichment(session: AsyncSession, enriched: dict[int, str]) -> None:
+    """Write job: store scraped text and release the enrich leases."""
+    now = utcnow()
+    for company_id, text in enriched.items():
+        await session.execute(
+            update(CompanyDB)
+            .where(CompanyDB.id == company_id)
+            .values(enriched_text=text, enriched_at=now)
         )
-    )
-    companies = result.scalars().all()
-    logger.info("Found %d companies to enrich", len(companies))
+    await release(session, "enrich", list(enriched))
 
-    tasks = [enrich_company(session, c) for c in companies]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    count = sum(1 for r in results if r is True)
-    await session.commit()
-    logger.info("Enrichment complete: %d/%d companies enriched", count, len(companies))
+async def run_enrichment(session: AsyncSession) -> int:
+    """Enrich all companies that haven't been enriched yet. Returns count.
+
+    Work is leased in batches of `enrich_batch_size`, so several replicas or
+    worker processes can run this concurrently without scraping the same site.
+    `session` is only used for reads; results go through the single writer.
+    """
+    count = attempted = 0
+    while ids := await claim_batch("enrich", settings.enrich_batch_size):
+        companies = await load_companies(session, ids)
+        attempted += len(companies)
+
+        tasks = [enrich_company(c) for c in companies]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        enriched = {c.id: r for c, r in zip(companies, results) if isinstance(r, str)}
+        await writer.submit(partial(save_enrichment, enriched=enriched))
+        count += len(enriched)
+        logger.info("Enrichment batch committed: %d/%d companies enriched", len(enriched), len(companies))
+
+    logger.info("Enrichment complete: %d/%d companies enriched", count, attempted)
     return count
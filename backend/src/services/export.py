@@ -0,0 +1,190 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Select, func, select
+
+from src.config import settings
+from src.db.database import export_session
+from src.models.company import CompanyDB
+from src.models.scores import ScoreDB
+from src.services.labels import load_labels
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+# Matches the export pool size, so a stream never waits on a connection.
+export_slots = asyncio.Semaphore(settings.export_max_concurrent)
+
+COMPANY_COLUMNS = [
+    "id", "name", "slug", "website", "one_liner", "long_description", "industry",
+    "subindustry", "status", "stage", "team_size", "batch", "tags", "regions", "enriched_at",
+]
+SCORE_COLUMNS = [
+    "thesis_fit", "market_timing", "product_clarity", "team_signal", "overall_signal",
+    "one_line_verdict", "model_used", "scored_at",
+]
+REASONING_DIMENSIONS = ["thesis_fit", "market_timing", "product_clarity", "team_signal", "overall_signal"]
+LIST_COLUMNS = {"tags", "regions"}
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def export_columns(include_reasoning: bool) -> list[str]:
+    columns = COMPANY_COLUMNS + SCORE_COLUMNS
+    if include_reasoning:
+        columns += [f"reasoning_{dim}" for dim in REASONING_DIMENSIONS]
+    return columns
+
+
+def build_export_query(include_reasoning: bool) -> Select:
+    """Companies joined with their latest score, without `enriched_text`."""
+    latest = (
+        select(ScoreDB.company_id, func.max(ScoreDB.id).label("score_id"))
+        .group_by(ScoreDB.company_id)
+        .subquery()
+    )
+    columns = [getattr(CompanyDB, c) for c in COMPANY_COLUMNS if c not in LIST_COLUMNS]
+    columns += [getattr(ScoreDB, c) for c in SCORE_COLUMNS]
+    if include_reasoning:
+        columns.append(ScoreDB.reasoning)
+
+    return (
+        select(*columns)
+        .outerjoin(latest, latest.c.company_id == CompanyDB.id)
+        .outerjoin(ScoreDB, ScoreDB.id == latest.c.score_id)
+        .order_by(CompanyDB.id)
+    )
+
+
+def _unpack_reasoning(value: str | None) -> dict:
+    try:
+        reasoning = json.loads(value) if value else {}
+    except (json.JSONDecodeError, TypeError):
+        reasoning = {}
+    if not isinstance(reasoning, dict):
+        reasoning = {}
+    return {f"reasoning_{dim}": reasoning.get(dim) for dim in REASONING_DIMENSIONS}
+
+
+def _to_record(row, labels: dict[str, dict[int, list[str]]], include_reasoning: bool) -> dict:
+    record = dict(row._mapping)
+    for column in LIST_COLUMNS:
+        record[column] = labels[column].get(record["id"], [])
+    if include_reasoning:
+        record.update(_unpack_reasoning(record.pop("reasoning")))
+    return record
+
+
+async def iter_batches(query: Select, include_reasoning: bool) -> AsyncIterator[list[dict]]:
+    """Stream `query` through a server-side cursor in EXPORT_BATCH_SIZE chunks.
+
+    Opens its own session on the export pool: the response body is produced
+    after the request handler returns, so the request-scoped session can't be
+    relied on here.
+    """
+    async with export_slots, export_session() as session:
+        result = await session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for partition in result.partitions():
+            labels = await load_labels(session, [row.id for row in partition])
+            yield [_to_record(row, labels, include_reasoning) for row in partition]
+
+
+async def encode_ndjson(batches: AsyncIterator[list[dict]], columns: list[str]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield "".join(json.dumps(record, default=str) + "\n" for record in batch).encode()
+
+
+async def encode_csv(batches: AsyncIterator[list[dict]], columns: list[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    async for batch in batches:
+        for record in batch:
+            for column in LIST_COLUMNS:
+                record[column] = "; ".join(record[column])
+            writer.writerow(record)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the caller."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema(columns: list[str]):
+    import pyarrow as pa
+
+    types = {
+        "id": pa.int64(),
+        "team_size": pa.int64(),
+        "tags": pa.list_(pa.string()),
+        "regions": pa.list_(pa.string()),
+        "enriched_at": pa.timestamp("us"),
+        "scored_at": pa.timestamp("us"),
+        **{dim: pa.int64() for dim in REASONING_DIMENSIONS},
+    }
+    return pa.schema([(c, types.get(c, pa.string())) for c in columns])
+
+
+async def encode_parquet(batches: AsyncIterator[list[dict]], columns: list[str]) -> AsyncIterator[bytes]:
+    """Write one row group per batch so memory stays bounded by EXPORT_BATCH_SIZE."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(columns)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        async for batch in batches:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+ENCODERS = {
+    "ndjson": encode_ndjson,
+    "csv": encode_csv,
+    "parquet": encode_parquet,
+}
+
+
+def stream_export(query: Select, fmt: str, include_reasoning: bool) -> AsyncIterator[bytes]:
+    """Encode the export query as a byte stream in the requested format."""
+    columns = export_columns(include_reasoning)
+    return ENCODERS[fmt](iter_batches(query, include_reasoning), columns)
@@ -0,0 +1,222 @@
+import logging
+from collections import Counter, OrderedDict
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.db.writer import writer
+from src.models.company import CompanyDB, CompanyRegionDB, CompanyTagDB
+from src.models.facets import DataGenerationDB, FacetCountDB
+from src.models.scores import ScoreDB
+from src.services.filters import CompanyFilters, apply_company_filters
+
+logger = logging.getLogger(__name__)
+
+COLUMN_FACETS = ["stage", "industry", "subindustry", "batch"]
+LABEL_FACETS = {"tags": CompanyTagDB.tag, "regions": CompanyRegionDB.region}
+FACETS = COLUMN_FACETS + list(LABEL_FACETS) + ["score"]
+UNSCORED = "unscored"
+CACHE_SIZE = 256
+
+# Which listing filter each facet ignores when counting, so a selected stage
+# still shows the other stages' counts (disjunctive faceting).
+OWN_FILTER = {
+    "stage": "stage",
+    "industry": "industry",
+    "batch": "batch",
+    "tags": "tags",
+    "regions": "regions",
+    "score": "min_score",
+}
+
+_cache: OrderedDict[tuple, dict] = OrderedDict()
+
+
+def company_facet_values(company: CompanyDB, tags: list[str], regions: list[str]) -> list[tuple[str, str]]:
+    """(facet, value) pairs a company with these labels contributes, excluding its score bucket."""
+    pairs = [(f, getattr(company, f)) for f in COLUMN_FACETS if getattr(company, f)]
+    pairs += [("tags", tag) for tag in tags]
+    pairs += [("regions", region) for region in regions]
+    return pairs
+
+
+def score_bucket(overall_signal: int | None) -> tuple[str, str]:
+    return ("score", str(overall_signal) if overall_signal is not None else UNSCORED)
+
+
+def filter_inputs(company: CompanyDB, tags: list[str], regions: list[str]) -> tuple:
+    """Everything listing filters or facet counts read from a company and its labels."""
+    return (company.name, company.one_liner, sorted(company_facet_values(company, tags, regions)))
+
+
+class FacetDelta:
+    """Accumulates facet count changes inside a write job, then applies them at once.
+
+    Callers `touch()` the delta whenever a facet or filter input changed, even
+    if the net unfiltered counts don't move (two companies swapping stages, a
+    renamed company): filtered facet counts still depend on it, so the data
+    generation has to advance.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.touched = False
+
+    def add(self, pairs: list[tuple[str, str]]) -> None:
+        self.counts.update(pairs)
+
+    def remove(self, pairs: list[tuple[str, str]]) -> None:
+        self.counts.subtract(pairs)
+
+    def touch(self) -> None:
+        self.touched = True
+
+    async def apply(self, session: AsyncSession) -> None:
+        changed = [(facet, value, n) for (facet, value), n in self.counts.items() if n]
+        if changed:
+            stmt = _insert(session, FacetCountDB).values(
+                [{"facet": facet, "value": value, "count": n} for facet, value, n in changed]
+            )
+            await session.execute(stmt.on_conflict_do_update(
+                index_elements=[FacetCountDB.facet, FacetCountDB.value],
+                set_={"count": FacetCountDB.count + stmt.excluded.count},
+            ))
+        if changed or self.touched:
+            await bump_generation(session)
+        self.counts.clear()
+        self.touched = False
+
+
+def _insert(session: AsyncSession, model):
+    insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+    return insert(model)
+
+
+async def bump_generation(session: AsyncSession) -> None:
+    await session.execute(
+        update(DataGenerationDB)
+        .where(DataGenerationDB.id == 1)
+        .values(generation=DataGenerationDB.generation + 1)
+    )
+
+
+async def _count_facet(session: AsyncSession, facet: str, filters: CompanyFilters) -> Counter:
+    """GROUP BY count for one facet over companies matching `filters`."""
+    if facet in LABEL_FACETS:
+        label = LABEL_FACETS[facet]
+        query = (
+            select(label, func.count(CompanyDB.id))
+            .join(CompanyDB, CompanyDB.id == label.class_.company_id)
+            .outerjoin(ScoreDB, CompanyDB.id == ScoreDB.company_id)
+            .group_by(label)
+        )
+        query = apply_company_filters(query, filters)
+        return Counter(dict((await session.execute(query)).all()))
+
+    column = ScoreDB.overall_signal if facet == "score" else getattr(CompanyDB, facet)
+    query = (
+        select(column, func.count(CompanyDB.id))
+        .outerjoin(ScoreDB, CompanyDB.id == ScoreDB.company_id)
+        .group_by(column)
+    )
+    query = apply_company_filters(query, filters)
+    rows = (await session.execute(query)).all()
+    if facet == "score":
+        return Counter({score_bucket(value)[1]: n for value, n in rows})
+    return Counter({value: n for value, n in rows if value})
+
+
+async def rebuild_facets(session: AsyncSession) -> None:
+    """Write job: recompute every precomputed facet count from scratch.
+
+    Upserts throughout, so two processes rebuilding at once both succeed.
+    """
+    await session.execute(delete(FacetCountDB))
+    rows = []
+    for facet in FACETS:
+        for value, n in (await _count_facet(session, facet, CompanyFilters())).items():
+            rows.append({"facet": facet, "value": value, "count": n})
+    if rows:
+        stmt = _insert(session, FacetCountDB).values(rows)
+        await session.execute(stmt.on_conflict_do_update(
+            index_elements=[FacetCountDB.facet, FacetCountDB.value],
+            set_={"count": stmt.excluded.count},
+        ))
+
+    await session.execute(
+        _insert(session, DataGenerationDB)
+        .values(id=1, generation=1)
+        .on_conflict_do_update(
+            index_elements=[DataGenerationDB.id],
+            set_={"generation": DataGenerationDB.generation + 1},
+        )
+    )
+    logger.info("Rebuilt %d facet counts", len(rows))
+
+
+async def ensure_facets(session: AsyncSession) -> None:
+    """Write job: build facet counts if this database has none yet.
+
+    Run at startup so the first /api/facets read never has to write.
+    """
+    if await session.scalar(select(DataGenerationDB.generation).where(DataGenerationDB.id == 1)) is None:
+        await rebuild_facets(session)
+
+
+async def _current_generation(session: AsyncSession) -> int | None:
+    """The data generation, or None when facet counts haven't been built yet.
+
+    Startup normally builds the counts (`ensure_facets`); failing that, the
+    first read builds them, except on serve-only replicas, which never write.
+    """
+    generation = await session.scalar(select(DataGenerationDB.generation).where(DataGenerationDB.id == 1))
+    if generation is None and not settings.serve_only:
+        await writer.submit(rebuild_facets)
+        await session.commit()
+        generation = await session.scalar(select(DataGenerationDB.generation).where(DataGenerationDB.id == 1))
+    return generation
+
+
+async def _precomputed(session: AsyncSession) -> dict[str, Counter]:
+    rows = (await session.execute(select(FacetCountDB.facet, FacetCountDB.value, FacetCountDB.count))).all()
+    counts: dict[str, Counter] = {facet: Counter() for facet in FACETS}
+    for facet, value, n in rows:
+        if n > 0:
+            counts[facet][value] = n
+    return counts
+
+
+async def get_facets(session: AsyncSession, filters: CompanyFilters) -> dict:
+    """Facet counts conditioned on the listing filters, cached per data generation.
+
+    Facets whose only active filter is their own are served from the
+    precomputed table; the rest are counted with a GROUP BY. Without
+    precomputed counts everything is counted and nothing is cached.
+    """
+    generation = await _current_generation(session)
+    key = (generation, filters)
+    if generation is not None and key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    precomputed = None
+    facets = {}
+    for facet in FACETS:
+        own = OWN_FILTER.get(facet)
+        facet_filters = filters.without(own) if own else filters
+        if generation is not None and facet_filters.is_empty():
+            precomputed = precomputed or await _precomputed(session)
+            counts = precomputed[facet]
+        else:
+            counts = await _count_facet(session, facet, facet_filters)
+        facets[facet] = [{"value": value, "count": n} for value, n in counts.most_common()]
+
+    response = {"generation": generation or 0, "facets": facets}
+    if generation is not None:
+        _cache[key] = response
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return response
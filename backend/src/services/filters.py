@@ -0,0 +1,64 @@
+from dataclasses import dataclass, fields, replace
+
+from sqlalchemy import ColumnElement, Select, distinct, func, select
+
+from src.models.company import CompanyDB, CompanyRegionDB, CompanyTagDB
+from src.models.scores import ScoreDB
+
+
+@dataclass(frozen=True)
+class CompanyFilters:
+    """Listing filters shared by /companies, /facets and /export. Hashable for caching."""
+    stage: str | None = None
+    industry: str | None = None
+    batch: str | None = None
+    min_score: int | None = None
+    search: str | None = None
+    tags: tuple[str, ...] = ()
+    tag_mode: str = "all"
+    regions: tuple[str, ...] = ()
+    region_mode: str = "all"
+
+    def without(self, name: str) -> "CompanyFilters":
+        """Copy with filter `name` reset to its default."""
+        default = next(f.default for f in fields(self) if f.name == name)
+        return replace(self, **{name: default})
+
+    def is_empty(self) -> bool:
+        return self == CompanyFilters(tag_mode=self.tag_mode, region_mode=self.region_mode)
+
+
+def _has_labels(model, column, values: tuple[str, ...], mode: str) -> ColumnElement[bool]:
+    """Companies carrying any (mode="any") or all (mode="all") of `values`.
+
+    Runs on the (label, company_id) index of the association table.
+    """
+    wanted = set(values)
+    matching = select(model.company_id).where(column.in_(wanted))
+    if mode == "all" and len(wanted) > 1:
+        matching = matching.group_by(model.company_id).having(
+            func.count(distinct(column)) == len(wanted)
+        )
+    return CompanyDB.id.in_(matching)
+
+
+def apply_company_filters(query: Select, filters: CompanyFilters) -> Select:
+    """Apply the shared listing/export filters to a query over CompanyDB/ScoreDB."""
+    if filters.stage:
+        query = query.where(CompanyDB.stage == filters.stage)
+    if filters.industry:
+        query = query.where(CompanyDB.industry == filters.industry)
+    if filters.batch:
+        query = query.where(CompanyDB.batch == filters.batch)
+    if filters.min_score is not None:
+        query = query.where(ScoreDB.overall_signal >= filters.min_score)
+    if filters.search:
+        query = query.where(
+            CompanyDB.name.ilike(f"%{filters.search}%")
+            | CompanyDB.one_liner.ilike(f"%{filters.search}%")
+        )
+    if filters.tags:
+        query = query.where(_has_labels(CompanyTagDB, CompanyTagDB.tag, filters.tags, filters.tag_mode))
+    if filters.regions:
+        query = query.where(_has_labels(CompanyRegionDB, CompanyRegionDB.region, filters.regions, filters.region_mode))
+    return query
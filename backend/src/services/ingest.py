@@ -1,43 +1,35 @@
-import json
 import logging
+from functools import partial
 
-import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
+from src.db.writer import writer
 from src.models.company import CompanyCreate, CompanyDB
+from src.resources import resources
+from src.services.facets import FacetDelta, company_facet_values, filter_inputs, score_bucket
+from src.services.labels import load_labels, replace_labels
 
 logger = logging.getLogger(__name__)
 
 YC_B2B_URL = f"{settings.yc_api_base}/industries/b2b.json"
+INGEST_CHUNK_SIZE = 500
 
 
 async def fetch_yc_companies() -> list[dict]:
     """Fetch B2B SaaS companies from YC-OSS public API."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(YC_B2B_URL)
-        response.raise_for_status()
-        return response.json()
+    response = await resources.http.get(YC_B2B_URL, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
 
 
-async def upsert_company(session: AsyncSession, company: CompanyCreate) -> CompanyDB:
-    """Insert or update a company by slug."""
-    result = await session.execute(
-        select(CompanyDB).where(CompanyDB.slug == company.slug)
-    )
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        for field in ["name", "website", "one_liner", "long_description",
-                       "industry", "subindustry", "status", "stage",
-                       "team_size", "batch"]:
-            setattr(existing, field, getattr(company, field))
-        existing.tags = json.dumps(company.tags)
-        existing.regions = json.dumps(company.regions)
-        return existing
-
-    db_company = CompanyDB(
+def _unique(values: list[str]) -> list[str]:
+    return list(dict.fromkeys(v for v in values if v))
+
+
+def _new_company(company: CompanyCreate) -> CompanyDB:
+    return CompanyDB(
         id=company.id,
         slug=company.slug,
         name=company.name,
@@ -50,28 +42,81 @@ async def upsert_company(session: AsyncSession, company: CompanyCreate) -> Compa
         stage=company.stage,
         team_size=company.team_size,
         batch=company.batch,
-        tags=json.dumps(company.tags),
-        regions=json.dumps(company.regions),
     )
-    session.add(db_company)
-    return db_company
+
+
+async def upsert_companies(session: AsyncSession, raw_companies: list[dict]) -> int:
+    """Write job: upsert a chunk of raw feed records by slug. Returns count upserted.
+
+    Existing rows and their labels are loaded once for the whole chunk, and
+    label changes are written with one bulk DELETE/INSERT per table.
+    """
+    companies = []
+    for raw in raw_companies:
+        try:
+            companies.append(CompanyCreate(**raw))
+        except Exception:
+            logger.exception("Failed to process company: %s", raw.get("name", "unknown"))
+    if not companies:
+        return 0
+
+    result = await session.execute(
+        select(CompanyDB).where(CompanyDB.slug.in_({c.slug for c in companies}))
+    )
+    by_slug = {row.slug: row for row in result.scalars()}
+    labels = await load_labels(session, [row.id for row in by_slug.values()])
+
+    delta = FacetDelta()
+    relabelled: set[int] = set()
+    for company in companies:
+        tags, regions = _unique(company.tags), _unique(company.regions)
+        existing = by_slug.get(company.slug)
+
+        if existing is None:
+            existing = by_slug[company.slug] = _new_company(company)
+            session.add(existing)
+            delta.add(company_facet_values(existing, tags, regions) + [score_bucket(None)])
+            delta.touch()
+        else:
+            old_tags = labels["tags"].get(existing.id, [])
+            old_regions = labels["regions"].get(existing.id, [])
+            before = filter_inputs(existing, old_tags, old_regions)
+            delta.remove(company_facet_values(existing, old_tags, old_regions))
+            for field in ["name", "website", "one_liner", "long_description",
+                          "industry", "subindustry", "status", "stage",
+                          "team_size", "batch"]:
+                setattr(existing, field, getattr(company, field))
+            delta.add(company_facet_values(existing, tags, regions))
+            if filter_inputs(existing, tags, regions) != before:
+                delta.touch()
+            if set(tags) == set(old_tags) and set(regions) == set(old_regions):
+                continue
+
+        labels["tags"][existing.id] = tags
+        labels["regions"][existing.id] = regions
+        relabelled.add(existing.id)
+
+    # Label rows reference companies, so new companies must be inserted first.
+    await session.flush()
+    await replace_labels(session, sorted(relabelled), labels)
+    await delta.apply(session)
+    return len(companies)
 
 
 async def run_ingestion(session: AsyncSession) -> int:
-    """Run the full ingestion pipeline. Returns count of upserted companies."""
+    """Run the full ingestion pipeline. Returns count of upserted companies.
+
+    Upserts are submitted to the single writer in chunks so a large feed
+    doesn't hold one write transaction open for the whole run.
+    """
     logger.info("Starting YC-OSS B2B ingestion from %s", YC_B2B_URL)
     raw_companies = await fetch_yc_companies()
     logger.info("Fetched %d companies from YC-OSS API", len(raw_companies))
 
     count = 0
-    for raw in raw_companies:
-        try:
-            company = CompanyCreate(**raw)
-            await upsert_company(session, company)
-            count += 1
-        except Exception:
-            logger.exception("Failed to process company: %s", raw.get("name", "unknown"))
+    for i in range(0, len(raw_companies), INGEST_CHUNK_SIZE):
+        chunk = raw_companies[i:i + INGEST_CHUNK_SIZE]
+        count += await writer.submit(partial(upsert_companies, raw_companies=chunk))
 
-    await session.commit()
     logger.info("Ingestion complete: %d companies upserted", count)
     return count
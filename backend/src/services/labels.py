@@ -0,0 +1,50 @@
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.company import CompanyRegionDB, CompanyTagDB
+
+# Association table and label column for each list field on a company.
+LABEL_TABLES = {
+    "tags": (CompanyTagDB, CompanyTagDB.tag),
+    "regions": (CompanyRegionDB, CompanyRegionDB.region),
+}
+
+Labels = dict[str, dict[int, list[str]]]
+
+
+async def load_labels(session: AsyncSession, ids: list[int]) -> Labels:
+    """Tags and regions for `ids`, keyed by field then company id.
+
+    One Core query per table, so loading labels for a page of companies
+    doesn't build an ORM object per label.
+    """
+    labels: Labels = {field: {} for field in LABEL_TABLES}
+    if not ids:
+        return labels
+    for field, (model, column) in LABEL_TABLES.items():
+        rows = await session.execute(
+            select(model.company_id, column).where(model.company_id.in_(ids)).order_by(model.company_id, column)
+        )
+        for company_id, value in rows:
+            labels[field].setdefault(company_id, []).append(value)
+    return labels
+
+
+async def replace_labels(session: AsyncSession, ids: list[int], labels: Labels) -> None:
+    """Replace the tags and regions of `ids` with `labels`. For use inside a write job.
+
+    One DELETE and one bulk INSERT per table, whatever the number of companies.
+    """
+    if not ids:
+        return
+    for field, (model, column) in LABEL_TABLES.items():
+        await session.execute(
+            delete(model).where(model.company_id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        rows = [
+            {"company_id": company_id, column.key: value}
+            for company_id in ids
+            for value in labels[field].get(company_id, [])
+        ]
+        if rows:
+            await session.execute(insert(model), rows)
@@ -0,0 +1,130 @@
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import ColumnElement, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.db.writer import writer
+from src.models.company import CompanyDB
+from src.models.scores import ScoreDB
+
+logger = logging.getLogger(__name__)
+
+LEASE_COLUMNS = {
+    "enrich": (CompanyDB.enrich_lease_owner, CompanyDB.enrich_lease_expires_at),
+    "score": (CompanyDB.score_lease_owner, CompanyDB.score_lease_expires_at),
+}
+# Lease bookkeeping isn't a change to the company, so suppress the
+# `updated_at` onupdate that CompanyResponse exposes.
+KEEP_UPDATED_AT = {CompanyDB.updated_at: CompanyDB.updated_at}
+
+
+def worker_id() -> str:
+    """Identity recorded on leased rows; unique per process unless configured."""
+    return settings.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+
+
+def utcnow() -> datetime:
+    # Lease columns are naive UTC: asyncpg rejects aware datetimes for
+    # TIMESTAMP WITHOUT TIME ZONE, and SQLite drops the offset anyway.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def eligible(stage: str) -> ColumnElement[bool]:
+    """Rows that still need work for `stage`, regardless of lease state."""
+    if stage == "enrich":
+        return (
+            CompanyDB.enriched_at.is_(None)
+            & CompanyDB.website.isnot(None)
+            & (CompanyDB.website != "")
+        )
+    if stage == "score":
+        return CompanyDB.id.notin_(select(ScoreDB.company_id))
+    raise ValueError(f"Unknown lease stage: {stage}")
+
+
+async def claim_batch(stage: str, limit: int) -> list[int]:
+    """Lease up to `limit` eligible companies for this worker. Returns ids.
+
+    PostgreSQL locks candidates with FOR UPDATE SKIP LOCKED so concurrent
+    claimers pass over each other's rows; SQLite serializes writers, so the
+    single conditional UPDATE is already atomic. Leases whose expiry has passed
+    (crashed or stuck workers) are treated as free.
+    """
+    owner_col, expires_col = LEASE_COLUMNS[stage]
+
+    async def claim(session: AsyncSession) -> list[int]:
+        now = utcnow()
+        available = or_(owner_col.is_(None), expires_col < now)
+        candidates = (
+            select(CompanyDB.id)
+            .where(eligible(stage), available)
+            .order_by(CompanyDB.id)
+            .limit(limit)
+        )
+        if session.bind.dialect.name == "postgresql":
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        result = await session.execute(
+            update(CompanyDB)
+            .where(CompanyDB.id.in_(candidates.scalar_subquery()), available)
+            .values({
+                owner_col: worker_id(),
+                expires_col: now + timedelta(seconds=settings.lease_seconds),
+                **KEEP_UPDATED_AT,
+            })
+            .returning(CompanyDB.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    ids = await writer.submit(claim)
+    logger.info("Claimed %d %s leases as %s", len(ids), stage, worker_id())
+    return ids
+
+
+async def load_companies(session: AsyncSession, ids: list[int], *options) -> list[CompanyDB]:
+    """Load claimed companies with optional loader `options`, then end the read transaction.
+
+    Holding a read snapshot open across a long batch would keep SQLite from
+    checkpointing the WAL.
+    """
+    result = await session.execute(select(CompanyDB).where(CompanyDB.id.in_(ids)).options(*options))
+    companies = list(result.scalars().all())
+    await session.commit()
+    return companies
+
+
+async def release(session: AsyncSession, stage: str, ids: list[int]) -> None:
+    """Drop this worker's leases on `ids`. For use inside a write job.
+
+    Failed items are deliberately not released: their lease runs out after
+    `lease_seconds`, which doubles as a retry backoff.
+    """
+    if not ids:
+        return
+    owner_col, expires_col = LEASE_COLUMNS[stage]
+    await session.execute(
+        update(CompanyDB)
+        .where(CompanyDB.id.in_(ids), owner_col == worker_id())
+        .values({owner_col: None, expires_col: None, **KEEP_UPDATED_AT})
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def clear_leases(session: AsyncSession, stage: str) -> None:
+    """Drop this worker's and expired leases for `stage`, e.g. before a full rescore.
+
+    Leases held by other live workers are left alone: those rows are being
+    worked on right now, and reclaiming them would pay for the same work twice.
+    """
+    owner_col, expires_col = LEASE_COLUMNS[stage]
+    await session.execute(
+        update(CompanyDB)
+        .where(owner_col.isnot(None), or_(owner_col == worker_id(), expires_col < utcnow()))
+        .values({owner_col: None, expires_col: None, **KEEP_UPDATED_AT})
+        .execution_options(synchronize_session=False)
+    )
@@ -1,32 +1,31 @@
 import asyncio
 import json
 import logging
-from pathlib import Path
+import time
+from functools import partial
 
 import anthropic
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.config import settings
+from src.db.writer import writer
+from src.metrics import LLM_ERRORS, LLM_REQUEST_DURATION, LLM_TOKENS, rate_limited
 from src.models.company import CompanyDB
 from src.models.scores import ScoreDB, ScoreResult
+from src.resources import resources
+from src.services.facets import FacetDelta, rebuild_facets, score_bucket
+from src.services.leasing import claim_batch, clear_leases, load_companies, release
 
 logger = logging.getLogger(__name__)
 
-THESIS_PROMPT_PATH = Path(__file__).parent.parent / "prompts" / "thesis.txt"
-THESIS_TEMPLATE = THESIS_PROMPT_PATH.read_text()
-
 semaphore = asyncio.Semaphore(settings.rate_limit_rps)
 
 
 def build_prompt(company: CompanyDB) -> str:
     """Format the thesis prompt with company data."""
-    tags = company.tags or "[]"
-    if isinstance(tags, str):
-        try:
-            tags = ", ".join(json.loads(tags))
-        except (json.JSONDecodeError, TypeError):
-            pass
+    tags = ", ".join(company.tags)
 
     replacements = {
         "{name}": company.name or "Unknown",
@@ -40,7 +39,7 @@ def build_prompt(company: CompanyDB) -> str:
         "{tags}": tags,
         "{enriched_text}": company.enriched_text or "No website data available",
     }
-    result = THESIS_TEMPLATE
+    result = resources.thesis.get()
     for placeholder, value in replacements.items():
         result = result.replace(placeholder, value)
     return result
@@ -48,16 +47,24 @@ def build_prompt(company: CompanyDB) -> str:
 
 async def score_company(company: CompanyDB) -> ScoreResult | None:
     """Score a single company using the Claude API."""
-    async with semaphore:
+    model = settings.model_name
+    async with rate_limited(semaphore, "score"):
         try:
-            client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
             prompt = build_prompt(company)
 
-            message = await client.messages.create(
-                model=settings.model_name,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                message = await resources.llm.messages.create(
+                    model=model,
+                    max_tokens=1024,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                outcome = "ok"
+            finally:
+                LLM_REQUEST_DURATION.labels(model, outcome).observe(time.perf_counter() - start)
+            LLM_TOKENS.labels(model, "input").inc(message.usage.input_tokens)
+            LLM_TOKENS.labels(model, "output").inc(message.usage.output_tokens)
 
             raw_text = message.content[0].text.strip()
             # Strip markdown code fences if present
@@ -71,19 +78,30 @@ async def score_company(company: CompanyDB) -> ScoreResult | None:
             return ScoreResult.from_llm_response(data)
 
         except (json.JSONDecodeError, anthropic.APIError) as e:
+            LLM_ERRORS.labels(model, type(e).__name__).inc()
             logger.error("Failed to score %s: %s", company.name, e)
             return None
-        except Exception:
+        except Exception as e:
+            LLM_ERRORS.labels(model, type(e).__name__).inc()
             logger.exception("Unexpected error scoring %s", company.name)
             return None
 
 
-async def upsert_score(session: AsyncSession, company_id: int, result: ScoreResult) -> ScoreDB:
-    """Insert or update a score for a company."""
+async def upsert_score(
+    session: AsyncSession, company_id: int, result: ScoreResult, delta: FacetDelta | None = None
+) -> ScoreDB:
+    """Insert or update a score for a company, recording the score-bucket change in `delta`."""
     existing = await session.execute(
         select(ScoreDB).where(ScoreDB.company_id == company_id)
     )
     score = existing.scalar_one_or_none()
+    if delta is not None:
+        before = score_bucket(score.overall_signal if score else None)
+        after = score_bucket(result.overall_signal)
+        delta.remove([before])
+        delta.add([after])
+        if before != after:
+            delta.touch()
 
     if score:
         score.thesis_fit = result.thesis_fit
@@ -111,65 +129,70 @@ async def upsert_score(session: AsyncSession, company_id: int, result: ScoreResu
     return score
 
 
-async def run_scoring(session: AsyncSession, batch_size: int | None = None) -> int:
-    """Score a batch of unscored companies. Returns count of scored companies."""
-    batch_size = batch_size or settings.score_batch_size
+async def save_scores(session: AsyncSession, results: dict[int, ScoreResult]) -> None:
+    """Write job: upsert scores, update score facets and release the score leases."""
+    delta = FacetDelta()
+    for company_id, score_result in results.items():
+        await upsert_score(session, company_id, score_result, delta)
+    await delta.apply(session)
+    await release(session, "score", list(results))
 
-    # Select companies that don't have a score yet
-    scored_ids = select(ScoreDB.company_id)
-    result = await session.execute(
-        select(CompanyDB)
-        .where(CompanyDB.id.notin_(scored_ids))
-        .limit(batch_size)
-    )
-    companies = result.scalars().all()
-    logger.info("Found %d unscored companies (batch size: %d)", len(companies), batch_size)
 
-    count = 0
+async def _score_leased(session: AsyncSession, ids: list[int]) -> int:
+    """Score leased companies and hand the results to the single writer."""
+    companies = await load_companies(session, ids, selectinload(CompanyDB.tag_rows))
+
+    results = {}
     for company in companies:
         score_result = await score_company(company)
         if score_result:
-            await upsert_score(session, company.id, score_result)
-            count += 1
+            results[company.id] = score_result
             logger.info("Scored %s: overall=%d", company.name, score_result.overall_signal)
 
-    await session.commit()
-    logger.info("Scoring complete: %d/%d companies scored", count, len(companies))
+    await writer.submit(partial(save_scores, results=results))
+    return len(results)
+
+
+async def run_scoring(session: AsyncSession, batch_size: int | None = None) -> int:
+    """Score a batch of unscored companies. Returns count of scored companies."""
+    batch_size = batch_size or settings.score_batch_size
+
+    # Lease unscored companies so concurrent replicas don't pay for the same LLM calls
+    ids = await claim_batch("score", batch_size)
+    logger.info("Claimed %d unscored companies (batch size: %d)", len(ids), batch_size)
+
+    count = await _score_leased(session, ids)
+    logger.info("Scoring complete: %d/%d companies scored", count, len(ids))
     return count
 
 
+async def _delete_all_scores(session: AsyncSession) -> None:
+    await session.execute(delete(ScoreDB))
+    await clear_leases(session, "score")
+    await rebuild_facets(session)
+
+
 async def run_rescore_all(session: AsyncSession, batch_size: int | None = None) -> int:
     """Delete all existing scores and rescore all companies. Returns count scored."""
-    from sqlalchemy import delete
     batch_size = batch_size or settings.score_batch_size
 
-    # Reload thesis template from disk (in case it changed)
-    global THESIS_TEMPLATE
-    THESIS_TEMPLATE = THESIS_PROMPT_PATH.read_text()
-    logger.info("Reloaded thesis template from %s", THESIS_PROMPT_PATH)
+    # Reload thesis template from disk even if the mtime didn't change
+    resources.thesis.reload()
 
     # Delete all existing scores
-    await session.execute(delete(ScoreDB))
-    await session.commit()
+    await writer.submit(_delete_all_scores)
     logger.info("Deleted all existing scores")
 
-    # Fetch all companies in batches
-    result = await session.execute(select(CompanyDB))
-    all_companies = result.scalars().all()
-    total = len(all_companies)
+    total = (await session.execute(select(func.count(CompanyDB.id)))).scalar() or 0
+    await session.commit()
     logger.info("Rescoring all %d companies (batch size: %d)", total, batch_size)
 
+    # Claim batches until nothing is left; other workers running run_scoring
+    # share the same queue. Failed companies keep their lease, so the loop ends.
     count = 0
-    for i in range(0, total, batch_size):
-        batch = all_companies[i:i + batch_size]
-        for company in batch:
-            score_result = await score_company(company)
-            if score_result:
-                await upsert_score(session, company.id, score_result)
-                count += 1
-                logger.info("Scored %s: overall=%d (%d/%d)", company.name, score_result.overall_signal, count, total)
-        await session.commit()
-        logger.info("Batch committed: %d/%d done", min(i + batch_size, total), total)
+    while ids := await claim_batch("score", batch_size):
+        count += await _score_leased(session, ids)
+        logger.info("Batch committed: %d/%d done", count, total)
 
     logger.info("Rescore complete: %d/%d companies scored", count, total)
     return count
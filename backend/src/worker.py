@@ -0,0 +1,58 @@
+"""Standalone pipeline worker.
+
+Runs enrichment or scoring in a loop against the shared database. Work is
+claimed through row leases, so any number of these can run alongside the API
+replicas:
+
+    python -m src.worker score --batch-size 20
+    python -m src.worker enrich --once
+"""
+import argparse
+import asyncio
+import logging
+
+from src.config import settings
+from src.db.database import init_db, read_session
+from src.db.writer import writer
+from src.resources import resources
+from src.services.enrich import run_enrichment
+from src.services.facets import ensure_facets
+from src.services.leasing import worker_id
+from src.services.scorer import run_scoring
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(stage: str, batch_size: int, idle_sleep: float, once: bool) -> None:
+    await init_db()
+    await writer.submit(ensure_facets)
+    logger.info("Worker %s starting %s loop", worker_id(), stage)
+    try:
+        while True:
+            async with read_session() as session:
+                if stage == "enrich":
+                    count = await run_enrichment(session)
+                else:
+                    count = await run_scoring(session, batch_size=batch_size)
+            if once:
+                return
+            if not count:
+                await asyncio.sleep(idle_sleep)
+    finally:
+        await writer.stop()
+        await resources.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("stage", choices=["enrich", "score"])
+    parser.add_argument("--batch-size", type=int, default=settings.score_batch_size)
+    parser.add_argument("--idle-sleep", type=float, default=30.0, help="seconds to wait when no work is available")
+    parser.add_argument("--once", action="store_true", help="process one round and exit")
+    args = parser.parse_args()
+    asyncio.run(run_worker(args.stage, args.batch_size, args.idle_sleep, args.once))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.db.database import export_engine, read_engine
+from src.main import app
+
+
+def test_exports_use_their_own_pool():
+    assert export_engine.pool is not read_engine.pool
+
+
+def test_export_rejected_when_all_slots_are_taken(monkeypatch):
+    monkeypatch.setattr(routes, "export_slots", asyncio.Semaphore(0))
+    response = TestClient(app).get("/api/export")
+    assert response.status_code == 429
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from src.db.writer import WriteQueue
+from src.models.facets import DataGenerationDB
+from src.services import facets
+from src.services.facets import ensure_facets, get_facets, rebuild_facets
+from src.services.filters import CompanyFilters
+from src.services.ingest import upsert_companies
+
+
+def _company(id: int, stage: str, tag: str, name: str | None = None) -> dict:
+    return {"id": id, "slug": f"company-{id}", "name": name or f"Company {id}", "stage": stage, "tags": [tag]}
+
+
+def _counts(response: dict, facet: str) -> dict[str, int]:
+    return {item["value"]: item["count"] for item in response["facets"][facet]}
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    facets._cache.clear()
+
+
+async def _write(session_factory, job, *args) -> None:
+    async with session_factory() as session:
+        await job(session, *args)
+        await session.commit()
+
+
+async def _facets(session_factory, filters: CompanyFilters) -> dict:
+    async with session_factory() as session:
+        return await get_facets(session, filters)
+
+
+def test_stage_swap_invalidates_filtered_facets(session_factory):
+    async def scenario():
+        await _write(session_factory, upsert_companies, [_company(1, "Seed", "AI"), _company(2, "Series A", "SaaS")])
+        await _write(session_factory, rebuild_facets)
+        before = await _facets(session_factory, CompanyFilters(tags=("AI",)))
+        assert _counts(before, "stage") == {"Seed": 1}
+
+        # Net unfiltered stage counts are unchanged by the swap.
+        await _write(session_factory, upsert_companies, [_company(1, "Series A", "AI"), _company(2, "Seed", "SaaS")])
+        after = await _facets(session_factory, CompanyFilters(tags=("AI",)))
+        assert after["generation"] > before["generation"]
+        assert _counts(after, "stage") == {"Series A": 1}
+
+    asyncio.run(scenario())
+
+
+def test_rename_invalidates_search_facets(session_factory):
+    async def scenario():
+        await _write(session_factory, upsert_companies, [_company(1, "Seed", "AI", name="Acme")])
+        await _write(session_factory, rebuild_facets)
+        before = await _facets(session_factory, CompanyFilters(search="Globex"))
+        assert _counts(before, "stage") == {}
+
+        await _write(session_factory, upsert_companies, [_company(1, "Seed", "AI", name="Globex")])
+        after = await _facets(session_factory, CompanyFilters(search="Globex"))
+        assert _counts(after, "stage") == {"Seed": 1}
+
+    asyncio.run(scenario())
+
+
+def test_unchanged_upsert_keeps_generation(session_factory):
+    async def scenario():
+        companies = [_company(1, "Seed", "AI")]
+        await _write(session_factory, upsert_companies, companies)
+        await _write(session_factory, rebuild_facets)
+        before = await _facets(session_factory, CompanyFilters())
+
+        await _write(session_factory, upsert_companies, companies)
+        after = await _facets(session_factory, CompanyFilters())
+        assert after["generation"] == before["generation"]
+
+    asyncio.run(scenario())
+
+
+def test_serve_only_counts_without_rebuilding(session_factory, monkeypatch):
+    monkeypatch.setattr(facets.settings, "serve_only", True)
+
+    async def scenario():
+        await _write(session_factory, upsert_companies, [_company(1, "Seed", "AI"), _company(2, "Seed", "SaaS")])
+        response = await _facets(session_factory, CompanyFilters())
+        assert _counts(response, "stage") == {"Seed": 2}
+        assert _counts(response, "tags") == {"AI": 1, "SaaS": 1}
+
+        async with session_factory() as session:
+            assert await session.get(DataGenerationDB, 1) is None
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_rebuilds_on_fresh_database(session_factory):
+    async def scenario():
+        await _write(session_factory, upsert_companies, [_company(1, "Seed", "AI")])
+        # Two writers stand in for two replicas serving their first facets read.
+        replicas = [WriteQueue(session_factory), WriteQueue(session_factory)]
+        await asyncio.gather(*(replica.submit(rebuild_facets) for replica in replicas))
+        for replica in replicas:
+            await replica.stop()
+        async with session_factory() as session:
+            return await session.get(DataGenerationDB, 1)
+
+    assert asyncio.run(scenario()).generation == 2
+
+
+def test_ensure_facets_only_builds_once(session_factory):
+    async def scenario():
+        await _write(session_factory, upsert_companies, [_company(1, "Seed", "AI")])
+        await _write(session_factory, ensure_facets)
+        await _write(session_factory, ensure_facets)
+        return await _facets(session_factory, CompanyFilters())
+
+    response = asyncio.run(scenario())
+    assert response["generation"] == 1
+    assert _counts(response, "stage") == {"Seed": 1}
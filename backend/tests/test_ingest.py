@@ -0,0 +1,72 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from src.models.company import CompanyDB
+from src.services.ingest import upsert_companies
+from src.services.labels import load_labels
+from src.services.leasing import load_companies
+
+
+def _company(id: int, tags: list[str], regions: list[str] = (), name: str | None = None) -> dict:
+    return {"id": id, "slug": f"company-{id}", "name": name or f"Company {id}", "tags": tags, "regions": list(regions)}
+
+
+async def _upsert(session_factory, raw: list[dict]) -> int:
+    async with session_factory() as session:
+        count = await upsert_companies(session, raw)
+        await session.commit()
+        return count
+
+
+async def _labels(session_factory, ids: list[int]) -> dict:
+    async with session_factory() as session:
+        return await load_labels(session, ids)
+
+
+def test_upsert_writes_and_replaces_labels(session_factory):
+    async def scenario():
+        await _upsert(session_factory, [
+            _company(1, ["AI", "SaaS", "AI"], ["Europe"]),
+            _company(2, ["Fintech"]),
+        ])
+        created = await _labels(session_factory, [1, 2])
+        await _upsert(session_factory, [_company(1, ["SaaS", "Security"], ["Europe"]), _company(2, ["Fintech"])])
+        updated = await _labels(session_factory, [1, 2])
+        return created, updated
+
+    created, updated = asyncio.run(scenario())
+    assert created == {"tags": {1: ["AI", "SaaS"], 2: ["Fintech"]}, "regions": {1: ["Europe"]}}
+    assert updated == {"tags": {1: ["SaaS", "Security"], 2: ["Fintech"]}, "regions": {1: ["Europe"]}}
+
+
+def test_duplicate_slug_in_one_chunk_keeps_last_record(session_factory):
+    async def scenario():
+        count = await _upsert(session_factory, [
+            _company(1, ["AI"], name="First"),
+            _company(1, ["SaaS"], name="Second"),
+        ])
+        async with session_factory() as session:
+            names = list((await session.execute(select(CompanyDB.name))).scalars())
+        return count, names, await _labels(session_factory, [1])
+
+    count, names, labels = asyncio.run(scenario())
+    assert count == 2
+    assert names == ["Second"]
+    assert labels["tags"] == {1: ["SaaS"]}
+
+
+def test_invalid_records_are_skipped(session_factory):
+    count = asyncio.run(_upsert(session_factory, [_company(1, ["AI"]), {"name": "missing id and slug"}]))
+    assert count == 1
+
+
+def test_load_companies_opts_into_labels(session_factory):
+    async def scenario():
+        await _upsert(session_factory, [_company(1, ["AI", "SaaS"])])
+        async with session_factory() as session:
+            companies = await load_companies(session, [1], selectinload(CompanyDB.tag_rows))
+        return companies[0].tags
+
+    assert sorted(asyncio.run(scenario())) == ["AI", "SaaS"]
@@ -0,0 +1,126 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from src.db.writer import WriteQueue
+from src.models.company import CompanyDB
+from src.services import leasing
+from src.services.leasing import claim_batch, clear_leases, release
+
+UPDATED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def queue(session_factory, monkeypatch):
+    queue = WriteQueue(session_factory)
+    monkeypatch.setattr(leasing, "writer", queue)
+    monkeypatch.setattr(leasing.settings, "worker_id", "worker-a")
+    return queue
+
+
+def _as_worker(monkeypatch, worker: str) -> None:
+    monkeypatch.setattr(leasing.settings, "worker_id", worker)
+
+
+async def _seed(session_factory, count: int) -> None:
+    async with session_factory() as session:
+        session.add_all(
+            CompanyDB(id=i, slug=f"company-{i}", name=f"Company {i}", updated_at=UPDATED_AT)
+            for i in range(1, count + 1)
+        )
+        await session.commit()
+
+
+async def _owners(session_factory) -> dict[int, str | None]:
+    async with session_factory() as session:
+        rows = await session.execute(select(CompanyDB.id, CompanyDB.score_lease_owner))
+        return dict(rows.all())
+
+
+async def _updated_at(session_factory) -> list[datetime]:
+    async with session_factory() as session:
+        return list((await session.execute(select(CompanyDB.updated_at))).scalars())
+
+
+def test_concurrent_claims_are_disjoint(session_factory, queue, monkeypatch):
+    async def scenario():
+        await _seed(session_factory, 10)
+        first, second = await asyncio.gather(claim_batch("score", 4), claim_batch("score", 4))
+        _as_worker(monkeypatch, "worker-b")
+        third = await claim_batch("score", 4)
+        await queue.stop()
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert len(first) == len(second) == 4
+    assert len(third) == 2
+    assert not set(first) & set(second)
+    assert not (set(first) | set(second)) & set(third)
+
+
+def test_expired_lease_is_reclaimed(session_factory, queue, monkeypatch):
+    async def scenario():
+        await _seed(session_factory, 3)
+        monkeypatch.setattr(leasing.settings, "lease_seconds", -1)
+        expired = await claim_batch("score", 3)
+        monkeypatch.setattr(leasing.settings, "lease_seconds", 600)
+        _as_worker(monkeypatch, "worker-b")
+        reclaimed = await claim_batch("score", 3)
+        await queue.stop()
+        return expired, reclaimed
+
+    expired, reclaimed = asyncio.run(scenario())
+    assert sorted(reclaimed) == sorted(expired) == [1, 2, 3]
+
+
+def test_release_only_drops_own_leases(session_factory, queue, monkeypatch):
+    async def scenario():
+        await _seed(session_factory, 2)
+        ids = await claim_batch("score", 2)
+        _as_worker(monkeypatch, "worker-b")
+        await queue.submit(lambda session: release(session, "score", ids))
+        after_other = await _owners(session_factory)
+        _as_worker(monkeypatch, "worker-a")
+        await queue.submit(lambda session: release(session, "score", ids))
+        after_own = await _owners(session_factory)
+        await queue.stop()
+        return after_other, after_own
+
+    after_other, after_own = asyncio.run(scenario())
+    assert after_other == {1: "worker-a", 2: "worker-a"}
+    assert after_own == {1: None, 2: None}
+
+
+def test_clear_leases_keeps_other_live_leases(session_factory, queue, monkeypatch):
+    async def scenario():
+        await _seed(session_factory, 3)
+        await claim_batch("score", 1)
+        _as_worker(monkeypatch, "worker-b")
+        await claim_batch("score", 1)
+        monkeypatch.setattr(leasing.settings, "lease_seconds", -1)
+        _as_worker(monkeypatch, "worker-c")
+        await claim_batch("score", 1)
+
+        _as_worker(monkeypatch, "worker-a")
+        await queue.submit(lambda session: clear_leases(session, "score"))
+        await queue.stop()
+        return await _owners(session_factory)
+
+    assert asyncio.run(scenario()) == {1: None, 2: "worker-b", 3: None}
+
+
+def test_leases_leave_updated_at_unchanged(session_factory, queue):
+    async def scenario():
+        await _seed(session_factory, 2)
+        ids = await claim_batch("score", 2)
+        claimed = await _updated_at(session_factory)
+        await queue.submit(lambda session: release(session, "score", ids))
+        await queue.submit(lambda session: clear_leases(session, "score"))
+        released = await _updated_at(session_factory)
+        await queue.stop()
+        return claimed, released
+
+    claimed, released = asyncio.run(scenario())
+    assert set(claimed) == set(released) == {UPDATED_AT}
@@ -0,0 +1,98 @@
+import json
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.db.database import Base
+from src.db.migrations import run_migrations
+from src.models import company, facets, scores  # noqa: F401  (register tables)
+
+# Schema as created by the baseline release, before leases and label tables.
+BASELINE_SCHEMA = """
+CREATE TABLE companies (
+    id INTEGER NOT NULL PRIMARY KEY,
+    slug VARCHAR NOT NULL,
+    name VARCHAR,
+    website VARCHAR,
+    one_liner TEXT,
+    long_description TEXT,
+    industry VARCHAR,
+    subindustry VARCHAR,
+    status VARCHAR,
+    stage VARCHAR,
+    team_size INTEGER,
+    batch VARCHAR,
+    tags TEXT,
+    regions TEXT,
+    enriched_text TEXT,
+    enriched_at DATETIME,
+    created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+    updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP)
+);
+CREATE UNIQUE INDEX ix_companies_slug ON companies (slug);
+CREATE TABLE scores (
+    id INTEGER NOT NULL PRIMARY KEY,
+    company_id INTEGER REFERENCES companies (id),
+    thesis_fit INTEGER,
+    market_timing INTEGER,
+    product_clarity INTEGER,
+    team_signal INTEGER,
+    overall_signal INTEGER,
+    one_line_verdict TEXT,
+    reasoning TEXT,
+    model_used VARCHAR,
+    scored_at DATETIME DEFAULT (CURRENT_TIMESTAMP)
+);
+CREATE INDEX ix_scores_company_id ON scores (company_id);
+"""
+
+
+@pytest.fixture
+def baseline_db(tmp_path):
+    path = tmp_path / "baseline.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executemany(
+        "INSERT INTO companies (id, slug, name, tags, regions) VALUES (?, ?, ?, ?, ?)",
+        [
+            (1, "acme", "Acme", json.dumps(["AI", "SaaS", "AI"]), json.dumps(["Europe"])),
+            (2, "globex", "Globex", json.dumps(["SaaS"]), None),
+            (3, "initech", "Initech", "not json", json.dumps([])),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return create_engine(f"sqlite:///{path}")
+
+
+def _upgrade(engine) -> None:
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        run_migrations(conn, Base.metadata)
+
+
+def test_upgrade_baseline_schema(baseline_db):
+    _upgrade(baseline_db)
+
+    inspector = inspect(baseline_db)
+    columns = {c["name"] for c in inspector.get_columns("companies")}
+    assert {"enrich_lease_owner", "score_lease_expires_at"} <= columns
+    assert not {"tags", "regions"} & columns
+    assert "ix_companies_slug" in {i["name"] for i in inspector.get_indexes("companies")}
+
+    with baseline_db.connect() as conn:
+        tags = conn.execute(text("SELECT company_id, tag FROM company_tags ORDER BY 1, 2")).all()
+        regions = conn.execute(text("SELECT company_id, region FROM company_regions")).all()
+        names = conn.execute(text("SELECT name FROM companies ORDER BY id")).scalars().all()
+    assert tags == [(1, "AI"), (1, "SaaS"), (2, "SaaS")]
+    assert regions == [(1, "Europe")]
+    assert names == ["Acme", "Globex", "Initech"]
+
+
+def test_upgrade_is_idempotent(baseline_db):
+    _upgrade(baseline_db)
+    _upgrade(baseline_db)
+
+    with baseline_db.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM company_tags")).scalar() == 3
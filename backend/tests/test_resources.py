@@ -0,0 +1,13 @@
+import asyncio
+
+from src.resources import Resources
+
+
+def test_open_leaves_the_llm_client_lazy():
+    resources = Resources()
+    resources.open()
+    try:
+        assert resources._http is not None
+        assert resources._llm is None
+    finally:
+        asyncio.run(resources.aclose())
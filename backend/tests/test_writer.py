@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from src.db import writer as writer_module
+from src.db.writer import WriteQueue
+from src.models.company import CompanyDB
+
+
+def _insert(company_id: int, calls: list | None = None):
+    async def job(session):
+        if calls is not None:
+            calls.append(company_id)
+        session.add(CompanyDB(id=company_id, slug=f"company-{company_id}", name=f"Company {company_id}"))
+        return company_id
+    return job
+
+
+async def _fail(session):
+    raise ValueError("bad job")
+
+
+async def _ids(session_factory) -> list[int]:
+    async with session_factory() as session:
+        return list((await session.execute(select(CompanyDB.id).order_by(CompanyDB.id))).scalars())
+
+
+def test_concurrent_jobs_share_one_commit(session_factory):
+    sessions = []
+
+    def record(result):
+        async def job(session):
+            sessions.append(session)
+            return result
+        return job
+
+    async def scenario():
+        queue = WriteQueue(session_factory)
+        results = await asyncio.gather(*(queue.submit(record(i)) for i in range(5)))
+        await queue.stop()
+        return results
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+    assert len({id(s) for s in sessions}) == 1
+
+
+def test_groups_are_capped_at_write_group_max(session_factory, monkeypatch):
+    monkeypatch.setattr(writer_module.settings, "write_group_max", 2)
+    sessions = []
+
+    async def job(session):
+        sessions.append(session)
+
+    async def scenario():
+        queue = WriteQueue(session_factory)
+        await asyncio.gather(*(queue.submit(job) for _ in range(5)))
+        await queue.stop()
+
+    asyncio.run(scenario())
+    assert len({id(s) for s in sessions}) == 3
+
+
+def test_failed_group_retries_jobs_individually(session_factory):
+    calls = []
+
+    async def scenario():
+        queue = WriteQueue(session_factory)
+        results = await asyncio.gather(
+            queue.submit(_insert(1, calls)),
+            queue.submit(_fail),
+            queue.submit(_insert(2, calls)),
+            return_exceptions=True,
+        )
+        await queue.stop()
+        return results, await _ids(session_factory)
+
+    results, ids = asyncio.run(scenario())
+    assert results[0] == 1 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+    assert ids == [1, 2]
+    # The group stopped at the failing job, then every job was retried on its own.
+    assert calls == [1, 1, 2]
+
+
+def test_cancelled_submitter_does_not_stop_the_writer(session_factory):
+    async def scenario():
+        queue = WriteQueue(session_factory)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow(session):
+            started.set()
+            await release.wait()
+            session.add(CompanyDB(id=1, slug="company-1", name="Company 1"))
+
+        submitter = asyncio.create_task(queue.submit(slow))
+        await started.wait()
+        submitter.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await submitter
+
+        # The cancelled job still commits, and the writer keeps serving.
+        assert await queue.submit(_insert(2)) == 2
+        await queue.stop()
+        return await _ids(session_factory)
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_stop_drains_queued_jobs(session_factory):
+    async def scenario():
+        queue = WriteQueue(session_factory)
+        pending = [asyncio.create_task(queue.submit(_insert(i))) for i in range(1, 4)]
+        await asyncio.sleep(0)
+        await queue.stop()
+        assert all(task.done() for task in pending)
+        return await _ids(session_factory)
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
@@ -19,6 +19,8 @@ function AppContent() {
     batch: "",
     min_score: "",
     search: "",
+    tag: "",
+    region: "",
   });
   const [selectedCompany, setSelectedCompany] = useState<Company | null>(null);
   const [page, setPage] = useState(1);
@@ -1,18 +1,43 @@
-import type { Filters as FiltersType } from "../types";
+import { useQuery } from "@tanstack/react-query";
+import { fetchFacets } from "../services/api";
+import type { FacetValue, Filters as FiltersType } from "../types";
 
 interface Props {
   filters: FiltersType;
   onChange: (filters: FiltersType) => void;
 }
 
-const STAGES = ["", "Seed", "Series A", "Series B", "Series C", "Growth", "IPO"];
-const SCORES = ["", "5", "6", "7", "8", "9"];
+const MIN_SCORES = [5, 6, 7, 8, 9];
+
+function scoreAtLeast(buckets: FacetValue[], min: number): number {
+  return buckets
+    .filter((b) => b.value !== "unscored" && Number(b.value) >= min)
+    .reduce((sum, b) => sum + b.count, 0);
+}
 
 export default function Filters({ filters, onChange }: Props) {
+  const { data } = useQuery({
+    queryKey: ["facets", filters],
+    queryFn: () => fetchFacets({ ...filters }),
+    placeholderData: (previous) => previous,
+  });
+  const facets = data?.facets;
+
   const update = (key: keyof FiltersType, value: string) => {
     onChange({ ...filters, [key]: value });
   };
 
+  const options = (values: FacetValue[] | undefined, selected: string) => {
+    const list = values ?? [];
+    // Keep the current selection visible even if it no longer has matches.
+    const withSelected = selected && !list.some((v) => v.value === selected)
+      ? [{ value: selected, count: 0 }, ...list]
+      : list;
+    return withSelected.map((v) => (
+      <option key={v.value} value={v.value}>{v.value} ({v.count})</option>
+    ));
+  };
+
   return (
     <div className="filters">
       <input
@@ -24,26 +49,30 @@ export default function Filters({ filters, onChange }: Props) {
       />
       <select value={filters.stage} onChange={(e) => update("stage", e.target.value)}>
         <option value="">All Stages</option>
-        {STAGES.filter(Boolean).map((s) => (
-          <option key={s} value={s}>{s}</option>
-        ))}
+        {options(facets?.stage, filters.stage)}
+      </select>
+      <select value={filters.industry} onChange={(e) => update("industry", e.target.value)}>
+        <option value="">All Industries</option>
+        {options(facets?.industry, filters.industry)}
+      </select>
+      <select value={filters.batch} onChange={(e) => update("batch", e.target.value)}>
+        <option value="">All Batches</option>
+        {options(facets?.batch, filters.batch)}
+      </select>
+      <select value={filters.tag} onChange={(e) => update("tag", e.target.value)}>
+        <option value="">All Tags</option>
+        {options(facets?.tags, filters.tag)}
+      </select>
+      <select value={filters.region} onChange={(e) => update("region", e.target.value)}>
+        <option value="">All Regions</option>
+        {options(facets?.regions, filters.region)}
       </select>
-      <input
-        type="text"
-        placeholder="Industry..."
-        value={filters.industry}
-        onChange={(e) => update("industry", e.target.value)}
-      />
-      <input
-        type="text"
-        placeholder="Batch (e.g. S21)..."
-        value={filters.batch}
-        onChange={(e) => update("batch", e.target.value)}
-      />
       <select value={filters.min_score} onChange={(e) => update("min_score", e.target.value)}>
         <option value="">Min Score</option>
-        {SCORES.filter(Boolean).map((s) => (
-          <option key={s} value={s}>{s}+</option>
+        {MIN_SCORES.map((s) => (
+          <option key={s} value={String(s)}>
+            {s}+{facets ? ` (${scoreAtLeast(facets.score, s)})` : ""}
+          </option>
         ))}
       </select>
     </div>
@@ -1,5 +1,5 @@
 import axios from "axios";
-import type { Company, CompanyDetail, Stats } from "../types";
+import type { Company, CompanyDetail, Facets, Stats } from "../types";
 
 const api = axios.create({
   baseURL: "http://localhost:8000/api",
@@ -18,6 +18,14 @@ export async function fetchCompany(id: number): Promise<CompanyDetail> {
   return data;
 }
 
+export async function fetchFacets(params: Record<string, string | number>): Promise<Facets> {
+  const cleaned = Object.fromEntries(
+    Object.entries(params).filter(([, v]) => v !== "" && v !== undefined)
+  );
+  const { data } = await api.get<Facets>("/facets", { params: cleaned });
+  return data;
+}
+
 export async function fetchStats(): Promise<Stats> {
   const { data } = await api.get<Stats>("/stats");
   return data;
@@ -60,4 +60,16 @@ export interface Filters {
   batch: string;
   min_score: string;
   search: string;
+  tag: string;
+  region: string;
+}
+
+export interface FacetValue {
+  value: string;
+  count: number;
+}
+
+export interface Facets {
+  generation: number;
+  facets: Record<"stage" | "industry" | "subindustry" | "batch" | "tags" | "regions" | "score", FacetValue[]>;
 }